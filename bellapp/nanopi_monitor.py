@@ -73,7 +73,6 @@ try:
     from luma.core.interface.serial import i2c
     from luma.core.render import canvas
     from luma.oled.device import ssd1306
-    from PIL import Image, ImageDraw, ImageFont
     import psutil
     import pytz
     LUMA_AVAILABLE = True
@@ -81,6 +80,24 @@ except ImportError as e:
     print(f"Warning: OLED display modules not available: {e}")
     LUMA_AVAILABLE = False
 
+# Pillow is only needed when a real display is driven; defer the import
+# until setup_display runs in non-mock mode so mock runs on the
+# memory-starved NanoPi skip the ~3 MB of RSS it costs.
+Image = ImageDraw = ImageFont = None
+
+def load_pil():
+    """Import Pillow lazily; returns True when available"""
+    global Image, ImageDraw, ImageFont
+    if Image is not None:
+        return True
+    try:
+        from PIL import Image as _Image, ImageDraw as _Draw, ImageFont as _Font
+        Image, ImageDraw, ImageFont = _Image, _Draw, _Font
+        return True
+    except ImportError as e:
+        print(f"Warning: Pillow not available: {e}")
+        return False
+
 # GPIO imports with fallback
 GPIO_AVAILABLE = False
 GPIO = None
@@ -155,7 +172,44 @@ class NanoPiOLEDMonitor:
             'temperature'
         ]
         self.current_mode = 0
+
+        # Per-mode refresh intervals: the clock needs 1 Hz, but system and
+        # temperature stats barely change between frames, so let the display
+        # thread (and the I2C bus) idle longer in those modes.
+        self._mode_intervals = {
+            'datetime': 1.0,
+            'system_info': 3.0,
+            'network_info': 5.0,
+            'temperature': 5.0
+        }
+        self._mode_changed = threading.Event()
+
+        # Draw dispatch table, aligned with display_modes: indexing a tuple
+        # of bound methods is cheaper than the old string if/elif chain.
+        self._draw_fns = (
+            self.draw_datetime,
+            self.draw_system_info,
+            self.draw_network_info,
+            self.draw_temperature
+        )
+
+        # Prerendered glyph tiles for the fixed bitmap font. Rendering each
+        # printable ASCII glyph once and blitting the cached tile is much
+        # cheaper than re-rasterizing through draw.text() every frame.
+        self._glyphs = {}
+        self._glyph_height = 0
+        self._glyph_advance = 6
        
+        # Shared framebuffer, allocated once in setup_display for real
+        # hardware. Reusing one Image/Draw pair avoids the per-frame
+        # allocation that luma's canvas context performs on entry.
+        self._img = None
+        self._draw = None
+
+        # Pending vertical-bar writes, set by draw_temperature and flushed
+        # after the frame with SSD1306 vertical addressing
+        self._vbar = None
+
         # GPIO setup for buttons (F1, F2, F3)
         self.button_pins = [6, 1, 67]  # Adjust based on your wiring
         self.gpio_initialized = False
@@ -171,16 +225,98 @@ class NanoPiOLEDMonitor:
         except:
             self.timezone = pytz.UTC
        
-        # Threading
+        # Threading. The display thread is the only writer to the OLED and
+        # button callbacks only flip current_mode (an atomic int assignment
+        # under the GIL), so no display lock is needed; config writes get
+        # their own lock instead.
         self.running = True
-        self.display_lock = threading.Lock()
+        self._config_lock = threading.Lock()
        
         # NTP sync
         self.last_ntp_sync = 0
         self.ntp_sync_interval = 3600  # 1 hour
+
+        # Cached /proc file descriptors for system stats: one pread per
+        # frame instead of psutil re-opening /proc/stat and /proc/meminfo
+        self._fd_stat = None
+        self._fd_mem = None
+        try:
+            self._fd_stat = os.open('/proc/stat', os.O_RDONLY)
+            self._fd_mem = os.open('/proc/meminfo', os.O_RDONLY)
+        except OSError:
+            pass
+        self._prev_jiffies = None
+        # statvfs result cached for 30 s; disk fullness moves slowly
+        self._disk_usage = None
+        self._disk_ts = 0.0
+
+        # Memory and disk totals never change while the process runs,
+        # so convert them to MB/GB once instead of every frame
+        self._mem_total_mb = 0
+        self._disk_total_gb = 0
+        if self._fd_mem is not None:
+            try:
+                for line in os.pread(self._fd_mem, 4096, 0).split(b'\n'):
+                    if line.startswith(b'MemTotal:'):
+                        self._mem_total_mb = int(line.split()[1]) >> 10
+                        break
+            except OSError:
+                pass
+        try:
+            st = os.statvfs('/')
+            self._disk_total_gb = (st.f_frsize * st.f_blocks) >> 30
+        except OSError:
+            pass
        
         self.logger.info("NanoPi OLED Monitor initialized")
 
+    def _build_glyph_cache(self):
+        """Prerender the glyphs the screens draw into small 1-bit tiles"""
+        try:
+            font = ImageFont.load_default()
+        except Exception as e:
+            self.logger.warning(f"Glyph cache build failed, falling back to draw.text: {e}")
+            self._glyphs = {}
+            return
+        # Visible ASCII plus the non-ASCII characters the screens
+        # actually use (degree sign in draw_temperature). Control
+        # characters are deliberately excluded.
+        chars = [chr(c) for c in range(32, 127)] + ['°']
+        for ch in chars:
+            try:
+                mask = font.getmask(ch)
+                width, height = mask.size
+                if width == 0 or height == 0:
+                    continue
+                tile = Image.new('1', (width, height))
+                ImageDraw.Draw(tile).text((0, 0), ch, fill=255, font=font)
+                self._glyphs[ch] = tile
+                self._glyph_height = max(self._glyph_height, height)
+            except Exception as e:
+                # One bad glyph must not discard the rest of the cache
+                self.logger.warning(f"Could not prerender glyph {ch!r}: {e}")
+        # Pen advance for blank or uncached characters (spaces render
+        # as an empty mask above, but still have to move the cursor)
+        widths = [t.width for t in self._glyphs.values()]
+        self._glyph_advance = (sum(widths) // len(widths)) if widths else 6
+
+    def _blit_text(self, draw, x, y, text):
+        """Draw text by pasting prerendered glyph tiles instead of rasterizing"""
+        if not self._glyphs:
+            draw.text((x, y), text, fill="white")
+            return
+        for ch in text:
+            tile = self._glyphs.get(ch)
+            if tile is None:
+                # Uncached character: rasterize it the slow way and keep
+                # the pen moving so later glyphs don't shift left
+                if not ch.isspace():
+                    draw.text((x, y), ch, fill="white")
+                x += self._glyph_advance
+                continue
+            draw.bitmap((x, y), tile, fill="white")
+            x += tile.width
+
     def load_config(self):
         """Load configuration from file"""
         default_config = {
@@ -206,8 +342,9 @@ class NanoPiOLEDMonitor:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with self._config_lock:
+                with open(self.config_file, 'w') as f:
+                    json.dump(self.config, f, indent=2)
         except Exception as e:
             self.logger.error(f"Could not save config: {e}")
 
@@ -248,7 +385,13 @@ class NanoPiOLEDMonitor:
             self.device = MockDevice()
             self.canvas_func = mock_canvas
             return
-            
+
+        if not load_pil():
+            self.logger.warning("Pillow not available, using mock display")
+            self.device = MockDevice()
+            self.canvas_func = mock_canvas
+            return
+
         try:
             # Try different I2C addresses
             addresses = [0x3C, 0x3D]
@@ -260,6 +403,9 @@ class NanoPiOLEDMonitor:
                     self.device = ssd1306(serial, width=128, height=64)
                     self.device.contrast(self.config['display_brightness'])
                     self.canvas_func = canvas
+                    self._img = Image.new('1', (128, 64))
+                    self._draw = ImageDraw.Draw(self._img)
+                    self._build_glyph_cache()
                     self.logger.info(f"OLED initialized at address 0x{addr:02X}")
                     break
                 except Exception as e:
@@ -282,6 +428,7 @@ class NanoPiOLEDMonitor:
             if channel == self.button_pins[0]:  # F1 - Change display mode
                 self.current_mode = (self.current_mode + 1) % len(self.display_modes)
                 self.logger.info(f"Switched to mode: {self.display_modes[self.current_mode]}")
+                self._mode_changed.set()  # Wake the display thread immediately
            
             elif channel == self.button_pins[1]:  # F2 - Change timezone
                 self.cycle_timezone()
@@ -352,20 +499,73 @@ class NanoPiOLEDMonitor:
             return False
 
     def get_system_info(self):
-        """Get system information"""
+        """Get system information from /proc with psutil as fallback"""
+        if self._fd_stat is None or self._fd_mem is None:
+            return self._get_system_info_psutil()
+
+        try:
+            # CPU: delta of jiffy counters from the first line of /proc/stat
+            fields = os.pread(self._fd_stat, 4096, 0).split(b'\n', 1)[0].split()[1:]
+            idle = int(fields[3]) + int(fields[4])  # idle + iowait
+            total = sum(int(f) for f in fields)
+            if self._prev_jiffies:
+                prev_total, prev_idle = self._prev_jiffies
+                delta_total = total - prev_total
+                if delta_total > 0:
+                    cpu_percent = 100.0 * (1.0 - (idle - prev_idle) / delta_total)
+                else:
+                    cpu_percent = 0.0
+            else:
+                cpu_percent = 0.0
+            self._prev_jiffies = (total, idle)
+
+            # Memory: MemTotal/MemAvailable sit in the first lines of meminfo
+            mem_total_kb = mem_avail_kb = 0
+            for line in os.pread(self._fd_mem, 4096, 0).split(b'\n'):
+                if line.startswith(b'MemTotal:'):
+                    mem_total_kb = int(line.split()[1])
+                elif line.startswith(b'MemAvailable:'):
+                    mem_avail_kb = int(line.split()[1])
+                    break
+            mem_used_kb = mem_total_kb - mem_avail_kb
+
+            # Refresh the cached statvfs at most every 30 seconds
+            if self._disk_usage is None or time.monotonic() - self._disk_ts > 30:
+                st = os.statvfs('/')
+                disk_total = st.f_frsize * st.f_blocks
+                disk_used = disk_total - st.f_frsize * st.f_bfree
+                self._disk_usage = (disk_used, disk_total)
+                self._disk_ts = time.monotonic()
+            disk_used, disk_total = self._disk_usage
+
+            return {
+                'cpu': cpu_percent,
+                'memory_percent': 100.0 * mem_used_kb / mem_total_kb if mem_total_kb else 0.0,
+                'memory_used': mem_used_kb >> 10,  # MB
+                'memory_total': self._mem_total_mb,
+                'disk_percent': 100.0 * disk_used / disk_total if disk_total else 0.0,
+                'disk_used': disk_used >> 30,  # GB
+                'disk_total': self._disk_total_gb
+            }
+        except Exception as e:
+            self.logger.error(f"System info error: {e}")
+            return self._get_system_info_psutil()
+
+    def _get_system_info_psutil(self):
+        """Fallback system information via psutil"""
         try:
             cpu_percent = psutil.cpu_percent(interval=0.1)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
-           
+
             return {
                 'cpu': cpu_percent,
                 'memory_percent': memory.percent,
-                'memory_used': memory.used // (1024**2),  # MB
-                'memory_total': memory.total // (1024**2),  # MB
+                'memory_used': memory.used >> 20,  # MB
+                'memory_total': memory.total >> 20,  # MB
                 'disk_percent': disk.percent,
-                'disk_used': disk.used // (1024**3),  # GB
-                'disk_total': disk.total // (1024**3)  # GB
+                'disk_used': disk.used >> 30,  # GB
+                'disk_total': disk.total >> 30  # GB
             }
         except Exception as e:
             self.logger.error(f"System info error: {e}")
@@ -458,60 +658,60 @@ class NanoPiOLEDMonitor:
             tz_str = str(self.timezone).split('/')[-1]
            
             # Draw text
-            draw.text((0, 0), date_str, fill="white")
-            draw.text((0, 20), time_str, fill="white")
-            draw.text((0, 40), f"TZ: {tz_str}", fill="white")
+            self._blit_text(draw, 0, 0, date_str)
+            self._blit_text(draw, 0, 20, time_str)
+            self._blit_text(draw, 0, 40, f"TZ: {tz_str}")
            
         except Exception as e:
-            draw.text((0, 0), f"Time Error: {str(e)[:15]}", fill="white")
+            self._blit_text(draw, 0, 0, f"Time Error: {str(e)[:15]}")
 
     def draw_system_info(self, draw, width, height):
         """Draw system information"""
         try:
             info = self.get_system_info()
             if not info:
-                draw.text((0, 0), "System info unavailable", fill="white")
+                self._blit_text(draw, 0, 0, "System info unavailable")
                 return
            
-            draw.text((0, 0), f"CPU: {info['cpu']:.1f}%", fill="white")
-            draw.text((0, 12), f"RAM: {info['memory_percent']:.1f}%", fill="white")
-            draw.text((0, 24), f"     {info['memory_used']}MB/{info['memory_total']}MB", fill="white")
-            draw.text((0, 36), f"Disk: {info['disk_percent']:.1f}%", fill="white")
-            draw.text((0, 48), f"      {info['disk_used']}GB/{info['disk_total']}GB", fill="white")
+            self._blit_text(draw, 0, 0, f"CPU: {info['cpu']:.1f}%")
+            self._blit_text(draw, 0, 12, f"RAM: {info['memory_percent']:.1f}%")
+            self._blit_text(draw, 0, 24, f"     {info['memory_used']}MB/{info['memory_total']}MB")
+            self._blit_text(draw, 0, 36, f"Disk: {info['disk_percent']:.1f}%")
+            self._blit_text(draw, 0, 48, f"      {info['disk_used']}GB/{info['disk_total']}GB")
            
         except Exception as e:
-            draw.text((0, 0), f"Sys Error: {str(e)[:15]}", fill="white")
+            self._blit_text(draw, 0, 0, f"Sys Error: {str(e)[:15]}")
 
     def draw_network_info(self, draw, width, height):
         """Draw network information"""
         try:
             info = self.get_network_info()
             if not info:
-                draw.text((0, 0), "Network info unavailable", fill="white")
+                self._blit_text(draw, 0, 0, "Network info unavailable")
                 return
            
-            draw.text((0, 0), "Network Info", fill="white")
+            self._blit_text(draw, 0, 0, "Network Info")
            
             y_pos = 12
             for ip in info['ip_addresses'][:2]:  # Show max 2 IPs
-                draw.text((0, y_pos), f"IP: {ip}", fill="white")
+                self._blit_text(draw, 0, y_pos, f"IP: {ip}")
                 y_pos += 12
            
-            draw.text((0, y_pos), f"TX: {info['bytes_sent']}MB", fill="white")
-            draw.text((0, y_pos + 12), f"RX: {info['bytes_recv']}MB", fill="white")
+            self._blit_text(draw, 0, y_pos, f"TX: {info['bytes_sent']}MB")
+            self._blit_text(draw, 0, y_pos + 12, f"RX: {info['bytes_recv']}MB")
            
         except Exception as e:
-            draw.text((0, 0), f"Net Error: {str(e)[:15]}", fill="white")
+            self._blit_text(draw, 0, 0, f"Net Error: {str(e)[:15]}")
 
     def draw_temperature(self, draw, width, height):
         """Draw temperature information"""
         try:
             temp = self.get_temperature()
            
-            draw.text((0, 0), "Temperature", fill="white")
+            self._blit_text(draw, 0, 0, "Temperature")
            
             if temp is not None:
-                draw.text((0, 20), f"CPU: {temp:.1f}°C", fill="white")
+                self._blit_text(draw, 0, 20, f"CPU: {temp:.1f}°C")
                
                 # Temperature status
                 if temp < 50:
@@ -521,33 +721,61 @@ class NanoPiOLEDMonitor:
                 else:
                     status = "HOT!"
                
-                draw.text((0, 40), f"Status: {status}", fill="white")
+                self._blit_text(draw, 0, 40, f"Status: {status}")
+
+                # Thermal bar on the right edge; flushed after the frame
+                # through the vertical-addressing fast path
+                level = max(0.0, min(temp, 80.0)) / 80.0
+                bar_height = max(8, int(level * 64) // 8 * 8)
+                self._vbar = [(x, 64 - bar_height, bar_height, 0xFF)
+                              for x in range(122, 126)]
             else:
-                draw.text((0, 20), "Temperature sensor", fill="white")
-                draw.text((0, 32), "not available", fill="white")
+                self._blit_text(draw, 0, 20, "Temperature sensor")
+                self._blit_text(draw, 0, 32, "not available")
                
         except Exception as e:
-            draw.text((0, 0), f"Temp Error: {str(e)[:15]}", fill="white")
+            self._blit_text(draw, 0, 0, f"Temp Error: {str(e)[:15]}")
+
+    def _write_vbar(self, x, y_top, height, pattern):
+        """Write a vertical bar as column bytes via SSD1306 vertical addressing
+
+        In vertical addressing mode one data byte covers an 8-pixel column
+        segment, so a full-height bar costs 8 bytes instead of 64 per-pixel
+        draw calls.
+        """
+        if not hasattr(self.device, 'command') or not hasattr(self.device, 'data'):
+            return
+        try:
+            page_top = y_top // 8
+            page_end = (y_top + height - 1) // 8
+            self.device.command(0x20, 0x01,             # vertical addressing
+                                0x21, x, x,             # single-column window
+                                0x22, page_top, page_end)
+            self.device.data(bytes([pattern]) * (page_end - page_top + 1))
+            self.device.command(0x20, 0x00)             # back to horizontal
+        except Exception as e:
+            self.logger.debug(f"Vertical bar write failed: {e}")
 
     def update_display(self):
         """Update the OLED display"""
         try:
-            with self.display_lock:
-                if not self.device:
-                    return
-               
+            if not self.device:
+                return
+
+            if self._img is not None:
+                # Clear and redraw into the preallocated buffer, then
+                # flush it in one go instead of going through canvas().
+                self._vbar = None
+                self._draw.rectangle((0, 0, 128, 64), fill=0)
+                self._draw_fns[self.current_mode](self._draw, 128, 64)
+                self.device.display(self._img)
+                if self._vbar:
+                    for args in self._vbar:
+                        self._write_vbar(*args)
+            else:
                 with self.canvas_func(self.device) as draw:
-                    mode = self.display_modes[self.current_mode]
-                   
-                    if mode == 'datetime':
-                        self.draw_datetime(draw, 128, 64)
-                    elif mode == 'system_info':
-                        self.draw_system_info(draw, 128, 64)
-                    elif mode == 'network_info':
-                        self.draw_network_info(draw, 128, 64)
-                    elif mode == 'temperature':
-                        self.draw_temperature(draw, 128, 64)
-                   
+                    self._draw_fns[self.current_mode](draw, 128, 64)
+
         except Exception as e:
             self.logger.error(f"Display update error: {e}")
 
@@ -562,7 +790,13 @@ class NanoPiOLEDMonitor:
             try:
                 self.auto_ntp_sync()
                 self.update_display()
-                time.sleep(self.config['refresh_rate'])
+                interval = self._mode_intervals.get(
+                    self.display_modes[self.current_mode],
+                    self.config['refresh_rate']
+                )
+                # Wait instead of sleep so a button press redraws instantly
+                if self._mode_changed.wait(interval):
+                    self._mode_changed.clear()
             except Exception as e:
                 self.logger.error(f"Display thread error: {e}")
                 time.sleep(5)
@@ -618,7 +852,14 @@ class NanoPiOLEDMonitor:
                 GPIO.cleanup()
         except:
             pass
-       
+
+        for fd in (self._fd_stat, self._fd_mem):
+            try:
+                if fd is not None:
+                    os.close(fd)
+            except:
+                pass
+
         self.logger.info("Cleanup completed")
 
 def create_systemd_service():
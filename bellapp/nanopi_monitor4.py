@@ -6,20 +6,34 @@ import os
 import sys
 import time
 import json
+import heapq
+import shutil
+import socket
 import threading
 import subprocess
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import signal
 import logging
 from pathlib import Path
 
-# Pygame import with error handling
+# Preferred playback backend: sounddevice's write-based mode blocks in
+# PortAudio C with no Python code on the audio thread, so it is immune to
+# the GIL-contention clicks and hangs pygame.mixer.music can produce
+try:
+    import sounddevice as sd
+    import soundfile as sf
+    SOUNDDEVICE_AVAILABLE = True
+except ImportError:
+    SOUNDDEVICE_AVAILABLE = False
+
+# Pygame import with error handling (fallback backend)
 try:
     import pygame
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
-    print("Warning: pygame not available, sound playback disabled")
+    if not SOUNDDEVICE_AVAILABLE:
+        print("Warning: pygame not available, sound playback disabled")
 
 # Existing imports
 try:
@@ -46,6 +60,12 @@ except ImportError:
     print("Warning: pytz not available, using basic timezone support")
     PYTZ_AVAILABLE = False
 
+# Timezones offered by the F2 button. Constructing a pytz timezone parses
+# its zoneinfo file, so build them all once and cycle via dict lookup.
+TZ_CHOICES = ['UTC', 'Africa/Johannesburg', 'US/Eastern', 'US/Pacific', 'Europe/London',
+              'Europe/Berlin', 'Asia/Shanghai', 'Asia/Tokyo', 'Australia/Sydney']
+_TZ_CACHE = {name: pytz.timezone(name) for name in TZ_CHOICES} if PYTZ_AVAILABLE else {}
+
 # GPIO imports
 GPIO_AVAILABLE = False
 GPIO = None
@@ -75,7 +95,7 @@ class MockCanvas:
     def __exit__(self, *args): pass
 
 class MockDraw:
-    def text(self, position, text, fill="white"): print(f"Display: {text}")
+    def text(self, position, text, fill="white", font=None): print(f"Display: {text}")
 
 def mock_canvas(device): return MockCanvas(device)
 
@@ -103,6 +123,9 @@ class NanoPiOLEDMonitor:
             'temperature': 70.0, 'cpu': 90.0, 'memory': 90.0, 'disk': 90.0
         })
         self.time_alarms = self.config.get('time_alarms', [])
+        # Hoisted out of the scheduler loop; also coerces a user-supplied
+        # string value ("1.0") that would otherwise blow up inside wait()
+        self._refresh_rate = self._coerce_refresh_rate()
 
         # Display modes
         self.display_modes = ['datetime', 'system_info', 'network_info', 'temperature']
@@ -120,32 +143,86 @@ class NanoPiOLEDMonitor:
         # Time zone
         try:
             if PYTZ_AVAILABLE:
-                self.timezone = pytz.timezone(self.config.get('timezone', 'Africa/Johannesburg'))
+                tz_name = self.config.get('timezone', 'Africa/Johannesburg')
+                self.timezone = _TZ_CACHE.get(tz_name) or pytz.timezone(tz_name)
             else:
                 self.timezone = timezone.utc
         except:
             self.timezone = pytz.UTC if PYTZ_AVAILABLE else timezone.utc
-
-        # Threading
-        self.running = True
+        # Cache the per-frame formatting inputs: the TZ label only changes
+        # in cycle_timezone and the date string only at midnight
+        self._tz_label = str(self.timezone).split('/')[-1] if PYTZ_AVAILABLE else "Local"
+        self._date_cache = (None, None)  # (day-of-month, formatted string)
+
+        # Threading. Shutdown is an Event so the main thread blocks with
+        # zero wakeups instead of polling a flag once a second.
+        self._stop = threading.Event()
         self.display_lock = threading.Lock()
+        # Set whenever time_alarms or the timezone change so the alarm
+        # scheduler rebuilds its fire-time heap
+        self._alarms_changed = threading.Event()
 
-        # NTP sync
+        # NTP sync. The poll interval adapts to observed clock stability:
+        # back off while measured offsets stay small, tighten when the RTC
+        # drifts, bounded by the min/max below.
         self.last_ntp_sync = 0
         self.ntp_sync_interval = 3600
-
-        # Initialize pygame mixer
-        global PYGAME_AVAILABLE
-        if PYGAME_AVAILABLE:
+        self.ntp_poll_min = 64
+        self.ntp_poll_max = 36 * 3600
+        self._ntp_offsets = []  # recent measured offsets, seconds
+        # Probe capabilities once: euid never changes, and shutil.which
+        # walks PATH in-process instead of forking `which` per server
+        self._is_root = os.geteuid() == 0
+        self._ntp_tool = 'ntpdate' if shutil.which('ntpdate') else 'timesyncd'
+
+        # Sensor reads at display refresh rate are mostly syscall overhead:
+        # resolve the temperature source (sysfs node or psutil hwmon entry)
+        # exactly once and hold readings for a few seconds instead of
+        # re-probing every candidate per tick
+        self._temp_source = self._resolve_temp_source()
+        self._temp_cache = (None, 0.0)
+        # Keep the sysfs node open and pread() it: no path lookup or file
+        # object churn per read
+        self._temp_fd = None
+        if self._temp_source and self._temp_source[0] == 'sysfs':
             try:
-                pygame.mixer.init()
-                self.logger.info("Pygame mixer initialized")
-            except Exception as e:
-                self.logger.warning(f"Failed to initialize pygame mixer: {e}")
-                PYGAME_AVAILABLE = False
+                self._temp_fd = os.open(self._temp_source[1], os.O_RDONLY)
+            except OSError as e:
+                self.logger.debug(f"Could not hold temperature fd open: {e}")
+        self._sysinfo_cache = (None, 0.0)
+        self._disk_cache = (None, 0.0)
+        self._ip_cache = ([], 0.0)
+        self._netio_cache = (0, 0, 0.0)
+        # Slow paths that just failed are skipped for 60 s rather than
+        # retried (and re-failed) on every frame
+        self._neg_cache = {}
+        if PSUTIL_AVAILABLE:
+            # Prime the sampler so later interval=None calls return the
+            # average since the previous call instead of blocking 100 ms
+            psutil.cpu_percent(interval=None)
+
+        # Precompiled formatter shared by the draw_* methods; concatenating
+        # onto static prefixes allocates less than rebuilding f-strings
+        self._fmt_pct = '{:.1f}%'.format
+        self._fmt_deg = '{:.1f}°C'.format
+
+        # Reused sounddevice output stream, opened on first playback.
+        # Playback threads share it, so the lock serializes the whole
+        # open/compare/write sequence (matching the old pygame.mixer
+        # one-sound-at-a-time semantics).
+        self._sd_stream = None
+        self._sd_lock = threading.Lock()
+
+        # The pygame mixer is initialized lazily on first playback: an idle
+        # mixer burns CPU continuously on Linux, and many sessions never
+        # fire an alarm at all
 
         self.logger.info("NanoPi OLED Monitor initialized")
 
+    @property
+    def running(self):
+        return not self._stop.is_set()
+
     def load_config(self):
         """Load configuration from file"""
         default_config = {
@@ -170,44 +247,152 @@ class NanoPiOLEDMonitor:
                 self.logger.warning(f"Could not load config: {e}")
         return default_config
 
+    def _coerce_refresh_rate(self):
+        """Read refresh_rate from config as a float, defaulting to 1.0"""
+        try:
+            return float(self.config.get('refresh_rate', 1.0))
+        except (TypeError, ValueError):
+            self.logger.warning(
+                f"Invalid refresh_rate {self.config.get('refresh_rate')!r}, using 1.0")
+            return 1.0
+
     def save_config(self):
         """Save configuration to file"""
         try:
+            self._refresh_rate = self._coerce_refresh_rate()
             with open(self.config_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
         except Exception as e:
             self.logger.error(f"Could not save config: {e}")
 
+    def _ensure_mixer(self):
+        """Initialize the pygame mixer on first use"""
+        global PYGAME_AVAILABLE
+        if not PYGAME_AVAILABLE:
+            return False
+        if pygame.mixer.get_init():
+            return True
+        try:
+            # The large buffer avoids underruns and audible pops when the
+            # NanoPi is under load
+            pygame.mixer.init(frequency=44100, size=-16, channels=1, buffer=4096)
+            self.logger.info("Pygame mixer initialized")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to initialize pygame mixer: {e}")
+            PYGAME_AVAILABLE = False
+            return False
+
+    def _play_sound_sd(self, sound_path):
+        """Play a file through a cached sounddevice output stream"""
+        try:
+            data, samplerate = sf.read(str(sound_path), dtype='float32')
+            channels = data.shape[1] if data.ndim > 1 else 1
+            # Two alarms can fire in the same scheduler pass; without the
+            # lock their threads would interleave chunks into one stream
+            # (or close it under the other thread's write)
+            with self._sd_lock:
+                stream = self._sd_stream
+                if (stream is None or stream.samplerate != samplerate
+                        or stream.channels != channels):
+                    if stream is not None:
+                        stream.close()
+                    stream = sd.OutputStream(samplerate=samplerate, channels=channels,
+                                             dtype='float32', blocksize=2048,
+                                             latency='high')
+                    stream.start()
+                    self._sd_stream = stream
+                self.logger.info(f"Playing sound: {sound_path.name}")
+                for i in range(0, len(data), 4096):
+                    if not self.running:
+                        break
+                    stream.write(data[i:i + 4096])
+        except Exception as e:
+            self.logger.error(f"Error playing sound {sound_path}: {e}")
+
     def play_sound(self, sound_file):
         """Play the specified sound file"""
-        if not PYGAME_AVAILABLE:
-            self.logger.warning("pygame not available or not initialized, cannot play sound")
-            return
         sound_path = self.sound_dir / sound_file
-        if sound_path.exists():
-            try:
-                pygame.mixer.music.load(str(sound_path))
-                pygame.mixer.music.play()
-                self.logger.info(f"Playing sound: {sound_file}")
-            except Exception as e:
-                self.logger.error(f"Error playing sound {sound_file}: {e}")
-        else:
+        if not sound_path.exists():
             self.logger.warning(f"Sound file not found: {sound_file}")
-
-    def check_time_alarms(self):
-        """Check and trigger time-based alarms"""
+            return
+        if SOUNDDEVICE_AVAILABLE:
+            # stream.write blocks until playback drains, so hand it to a
+            # fire-and-forget daemon thread
+            threading.Thread(target=self._play_sound_sd, args=(sound_path,),
+                             daemon=True, name="SoundPlayer").start()
+            return
+        if not self._ensure_mixer():
+            self.logger.warning("No audio backend available, cannot play sound")
+            return
+        try:
+            pygame.mixer.music.load(str(sound_path))
+            pygame.mixer.music.play()
+            self.logger.info(f"Playing sound: {sound_file}")
+        except Exception as e:
+            self.logger.error(f"Error playing sound {sound_file}: {e}")
+
+    def _rebuild_alarm_heap(self):
+        """Build a min-heap of (next_fire_epoch, index) for enabled alarms"""
+        heap = []
+        now = datetime.now(self.timezone)
+        for idx, alarm in enumerate(self.time_alarms):
+            if not alarm.get('enabled', True):
+                continue
+            try:
+                hour, minute = map(int, alarm['time'].split(':'))
+                fire = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            except (KeyError, ValueError) as e:
+                self.logger.warning(f"Skipping malformed alarm {alarm}: {e}")
+                continue
+            if fire <= now:
+                fire += timedelta(days=1)
+            heapq.heappush(heap, (fire.timestamp(), idx))
+        return heap
+
+    def _fire_alarm(self, idx):
+        """Play the sound for one due alarm"""
+        try:
+            alarm = self.time_alarms[idx]
+            self.play_sound(alarm['sound'])
+            self.logger.info(f"Time alarm triggered: {alarm['time']} with {alarm['sound']}")
+        except Exception as e:
+            self.logger.error(f"Error firing alarm {idx}: {e}")
+
+    def scheduler_loop(self):
+        """Single scheduler loop driving display refresh, NTP and alarms
+
+        One mostly-sleeping thread owns all the periodic work instead of a
+        display thread, an alarm thread and a main busy-wait. Each pass
+        fires whatever is due, then sleeps until the earliest of the next
+        display refresh and the next alarm. The wait is interruptible so
+        alarm/timezone edits rebuild the heap immediately, and a late
+        wakeup can no longer skip an alarm at a minute boundary.
+        """
+        heap = self._rebuild_alarm_heap()
+        next_refresh = time.monotonic()
         while self.running:
             try:
-                now = datetime.now(self.timezone)
-                current_time = now.strftime("%H:%M")
-                for alarm in self.time_alarms:
-                    if alarm['time'] == current_time and alarm.get('enabled', True):
-                        self.play_sound(alarm['sound'])
-                        self.logger.info(f"Time alarm triggered: {alarm['time']} with {alarm['sound']}")
-                time.sleep(60)  # Check every minute
+                if time.monotonic() >= next_refresh:
+                    self.auto_ntp_sync()
+                    self.update_display()
+                    next_refresh = time.monotonic() + self._refresh_rate
+
+                now = time.time()
+                while heap and heap[0][0] <= now:
+                    fire_ts, idx = heapq.heappop(heap)
+                    self._fire_alarm(idx)
+                    heapq.heappush(heap, (fire_ts + 86400.0, idx))
+
+                timeout = next_refresh - time.monotonic()
+                if heap:
+                    timeout = min(timeout, heap[0][0] - time.time())
+                if timeout > 0 and self._alarms_changed.wait(min(timeout, 3600.0)):
+                    self._alarms_changed.clear()
+                    heap = self._rebuild_alarm_heap()
             except Exception as e:
-                self.logger.error(f"Error checking time alarms: {e}")
-                time.sleep(60)
+                self.logger.error(f"Scheduler loop error: {e}")
+                self._stop.wait(5)
 
     def setup_gpio(self):
         if not GPIO_AVAILABLE:
@@ -221,19 +406,51 @@ class NanoPiOLEDMonitor:
             GPIO.setwarnings(False)
             for pin in self.button_pins:
                 GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-                GPIO.add_event_detect(pin, GPIO.FALLING, callback=self.button_callback, bouncetime=200)
             self.gpio_initialized = True
             self.logger.info("GPIO setup completed")
         except Exception as e:
             self.logger.warning(f"GPIO setup failed: {e}")
 
+    def _button_poll(self):
+        """Poll all buttons from one thread instead of edge-detect interrupts
+
+        Edge-detect callbacks are unreliable across kernels on these boards;
+        a single 50 Hz polling loop is portable, uses one thread for all
+        three buttons and gives a deterministic 200 ms debounce window.
+        """
+        last_state = {pin: 1 for pin in self.button_pins}
+        last_fire = {pin: 0.0 for pin in self.button_pins}
+        while self.running:
+            try:
+                for pin in self.button_pins:
+                    state = GPIO.input(pin)
+                    now = time.monotonic()
+                    if state == 0 and last_state[pin] == 1 and now - last_fire[pin] > 0.2:
+                        last_fire[pin] = now
+                        self.button_callback(pin)
+                    last_state[pin] = state
+            except Exception as e:
+                self.logger.error(f"Button poll error: {e}")
+            self._stop.wait(0.02)
+
     def setup_display(self):
+        self._font = None
+        self._last_frame_state = None
+        # Reusable framebuffer for real hardware; _last_fb holds the bytes
+        # of the previously flushed frame so identical frames skip the I2C
+        # transfer entirely
+        self._img = None
+        self._draw = None
+        self._last_fb = None
         if not LUMA_AVAILABLE or self.config.get('mock_mode', False):
             self.logger.info("Using mock display (hardware not available)")
             self.device = MockDevice()
             self.canvas_func = mock_canvas
             return
         try:
+            # Resolve the bitmap font once; draw.text otherwise reloads the
+            # default font on every call
+            self._font = ImageFont.load_default()
             addresses = [0x3C, 0x3D]
             self.device = None
             for addr in addresses:
@@ -242,6 +459,8 @@ class NanoPiOLEDMonitor:
                     self.device = ssd1306(serial, width=128, height=64)
                     self.device.contrast(self.config['display_brightness'])
                     self.canvas_func = canvas
+                    self._img = Image.new('1', (128, 64))
+                    self._draw = ImageDraw.Draw(self._img)
                     self.logger.info(f"OLED initialized at address 0x{addr:02X}")
                     break
                 except Exception as e:
@@ -271,31 +490,62 @@ class NanoPiOLEDMonitor:
         if not PYTZ_AVAILABLE:
             self.logger.warning("pytz not available, timezone cycling disabled")
             return
-        timezones = ['UTC', 'Africa/Johannesburg', 'US/Eastern', 'US/Pacific', 'Europe/London',
-                     'Europe/Berlin', 'Asia/Shanghai', 'Asia/Tokyo', 'Australia/Sydney']
         try:
             current_tz = self.config['timezone']
-            current_index = timezones.index(current_tz) if current_tz in timezones else 0
-            next_index = (current_index + 1) % len(timezones)
-            self.config['timezone'] = timezones[next_index]
-            self.timezone = pytz.timezone(timezones[next_index])
+            current_index = TZ_CHOICES.index(current_tz) if current_tz in TZ_CHOICES else 0
+            next_index = (current_index + 1) % len(TZ_CHOICES)
+            next_name = TZ_CHOICES[next_index]
+            self.config['timezone'] = next_name
+            self.timezone = _TZ_CACHE[next_name]
+            self._tz_label = next_name.split('/')[-1]
+            self._date_cache = (None, None)
             self.save_config()
-            self.logger.info(f"Timezone changed to: {timezones[next_index]}")
+            self._alarms_changed.set()  # fire times shift with the timezone
+            self.logger.info(f"Timezone changed to: {next_name}")
         except Exception as e:
             self.logger.error(f"Timezone change error: {e}")
 
+    def _measure_ntp_offset(self, server):
+        """Query (without setting) the clock offset against a server"""
+        try:
+            result = subprocess.run(['ntpdate', '-q', server], timeout=10,
+                                    capture_output=True, text=True)
+            tokens = result.stdout.replace(',', ' ').split()
+            for i, token in enumerate(tokens):
+                if token == 'offset' and i + 1 < len(tokens):
+                    return float(tokens[i + 1])
+        except Exception as e:
+            self.logger.debug(f"NTP offset query failed for {server}: {e}")
+        return None
+
+    def _update_ntp_interval(self, offset):
+        """Adapt the poll interval to how stable the clock has been"""
+        self._ntp_offsets.append(abs(offset))
+        if len(self._ntp_offsets) > 8:
+            self._ntp_offsets.pop(0)
+        mean_abs_error = sum(self._ntp_offsets) / len(self._ntp_offsets)
+        if mean_abs_error < 0.1:
+            self.ntp_sync_interval = min(self.ntp_sync_interval * 2, self.ntp_poll_max)
+        else:
+            self.ntp_sync_interval = max(self.ntp_sync_interval // 2, self.ntp_poll_min)
+        self.logger.debug(
+            f"NTP mean abs offset {mean_abs_error:.3f}s, "
+            f"poll interval now {self.ntp_sync_interval}s")
+
     def sync_ntp(self):
         try:
-            if os.geteuid() != 0:
+            if not self._is_root:
                 self.logger.debug("NTP sync skipped: requires root privileges")
                 self.last_ntp_sync = time.time()
                 return False
             for server in self.config['ntp_servers']:
                 try:
-                    result = subprocess.run(['which', 'ntpdate'], capture_output=True, text=True)
-                    if result.returncode == 0:
+                    if self._ntp_tool == 'ntpdate':
+                        offset = self._measure_ntp_offset(server)
                         subprocess.check_call(['ntpdate', '-s', server], timeout=10,
                                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                        if offset is not None:
+                            self._update_ntp_interval(offset)
                     else:
                         subprocess.check_call(['systemctl', 'restart', 'systemd-timesyncd'], timeout=10,
                                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -322,194 +572,263 @@ class NanoPiOLEDMonitor:
         if not PSUTIL_AVAILABLE:
             return {'cpu': 0, 'memory_percent': 0, 'memory_used': 0, 'memory_total': 0,
                     'disk_percent': 0, 'disk_used': 0, 'disk_total': 0}
+        info, ts = self._sysinfo_cache
+        if info is not None and time.monotonic() - ts < 2.0:
+            return info
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            return {
+            disk, disk_ts = self._disk_cache
+            if disk is None or time.monotonic() - disk_ts > 30.0:
+                disk = psutil.disk_usage('/')
+                self._disk_cache = (disk, time.monotonic())
+            info = {
                 'cpu': cpu_percent, 'memory_percent': memory.percent,
                 'memory_used': memory.used // (1024**2), 'memory_total': memory.total // (1024**2),
                 'disk_percent': disk.percent, 'disk_used': disk.used // (1024**3),
                 'disk_total': disk.total // (1024**3)
             }
+            self._sysinfo_cache = (info, time.monotonic())
+            return info
         except Exception as e:
             self.logger.error(f"System info error: {e}")
             return None
 
     def get_network_info(self):
         try:
-            ip_addresses = []
-            try:
-                result = subprocess.run(['hostname', '-I'], capture_output=True, text=True, timeout=5)
-                ip_addresses = result.stdout.strip().split()
-            except:
+            # IPs via an in-process lookup cached for 60 s; forking
+            # `hostname -I` per refresh cost >10 ms on the SoC
+            ip_addresses, ip_ts = self._ip_cache
+            if (not ip_addresses or time.monotonic() - ip_ts > 60.0) \
+                    and not self._neg_cached('getaddrinfo'):
                 try:
-                    import socket
-                    hostname = socket.gethostname()
-                    ip_addresses = [socket.gethostbyname(hostname)]
-                except:
+                    infos = socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET)
+                    ip_addresses = sorted({info[4][0] for info in infos})
+                except (OSError, socket.gaierror) as e:
+                    self.logger.debug(f"Address lookup failed: {e}")
+                    self._neg_cache['getaddrinfo'] = time.monotonic()
                     ip_addresses = ['Unknown']
-            bytes_sent = bytes_recv = 0
-            if PSUTIL_AVAILABLE:
+                self._ip_cache = (ip_addresses, time.monotonic())
+
+            bytes_sent, bytes_recv, io_ts = self._netio_cache
+            if PSUTIL_AVAILABLE and time.monotonic() - io_ts > 2.0:
                 try:
                     net_io = psutil.net_io_counters()
                     bytes_sent = net_io.bytes_sent // (1024**2)
                     bytes_recv = net_io.bytes_recv // (1024**2)
-                except:
+                    self._netio_cache = (bytes_sent, bytes_recv, time.monotonic())
+                except OSError:
                     pass
             return {'ip_addresses': ip_addresses, 'bytes_sent': bytes_sent, 'bytes_recv': bytes_recv}
         except Exception as e:
             self.logger.error(f"Network info error: {e}")
             return None
 
+    def _neg_cached(self, key):
+        """True while a recently failed slow path should still be skipped"""
+        ts = self._neg_cache.get(key)
+        return ts is not None and time.monotonic() - ts < 60.0
+
+    def _resolve_temp_source(self):
+        """Pick the temperature source once at startup"""
+        for path in ('/sys/class/thermal/thermal_zone0/temp',
+                     '/sys/class/hwmon/hwmon0/temp1_input',
+                     '/sys/class/hwmon/hwmon1/temp1_input'):
+            if os.path.exists(path):
+                return ('sysfs', path)
+        if PSUTIL_AVAILABLE:
+            try:
+                for name, entries in (psutil.sensors_temperatures() or {}).items():
+                    if entries:
+                        return ('psutil', name)
+            except (AttributeError, OSError) as e:
+                self.logger.debug(f"psutil temperature probe failed: {e}")
+        return None
+
     def get_temperature(self):
-        try:
-            temp_files = ['/sys/class/thermal/thermal_zone0/temp',
-                          '/sys/class/hwmon/hwmon0/temp1_input',
-                          '/sys/class/hwmon/hwmon1/temp1_input']
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    with open(temp_file, 'r') as f:
-                        temp = int(f.read().strip()) / 1000.0
-                        return temp
-            if PSUTIL_AVAILABLE:
-                try:
-                    temps = psutil.sensors_temperatures()
-                    if temps:
-                        for name, entries in temps.items():
-                            if entries:
-                                return entries[0].current
-                except:
-                    pass
+        value, ts = self._temp_cache
+        if value is not None and time.monotonic() - ts < 5.0:
+            return value
+        if self._temp_source is None or self._neg_cached('temperature'):
             return None
-        except Exception as e:
-            self.logger.error(f"Temperature reading error: {e}")
+        kind, source = self._temp_source
+        try:
+            if kind == 'sysfs':
+                if self._temp_fd is not None:
+                    value = int(os.pread(self._temp_fd, 16, 0).strip()) / 1000.0
+                else:
+                    with open(source, 'r') as f:
+                        value = int(f.read().strip()) / 1000.0
+            else:
+                entries = psutil.sensors_temperatures().get(source)
+                if not entries:
+                    raise OSError(f"hwmon source {source} disappeared")
+                value = entries[0].current
+            self._temp_cache = (value, time.monotonic())
+            return value
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.debug(f"Temperature read failed: {e}")
+            self._neg_cache['temperature'] = time.monotonic()
             return None
 
     def draw_datetime(self, draw, width, height):
         try:
-            if PYTZ_AVAILABLE:
-                now = datetime.now(self.timezone)
-                tz_str = str(self.timezone).split('/')[-1]
-            else:
-                now = datetime.now()
-                tz_str = "Local"
-            date_str = now.strftime("%a, %b %d %Y")
+            now = datetime.now(self.timezone) if PYTZ_AVAILABLE else datetime.now()
+            tz_str = self._tz_label
+            # Only reformat the date when the day rolls over; the seconds
+            # clock is the sole per-frame strftime
+            cached_day, date_str = self._date_cache
+            if cached_day != now.day:
+                date_str = now.strftime("%a, %b %d %Y")
+                self._date_cache = (now.day, date_str)
             time_str = now.strftime("%H:%M:%S")
-            draw.text((0, 0), date_str, fill="white")
-            draw.text((0, 20), time_str, fill="white")
-            draw.text((0, 40), f"TZ: {tz_str}", fill="white")
+            draw.text((0, 0), date_str, fill="white", font=self._font)
+            draw.text((0, 20), time_str, fill="white", font=self._font)
+            draw.text((0, 40), f"TZ: {tz_str}", fill="white", font=self._font)
         except Exception as e:
-            draw.text((0, 0), f"Time Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Time Error: {str(e)[:15]}", fill="white", font=self._font)
 
     def draw_system_info(self, draw, width, height):
         try:
             info = self.get_system_info()
             if not info:
-                draw.text((0, 0), "System info unavailable", fill="white")
+                draw.text((0, 0), "System info unavailable", fill="white", font=self._font)
                 return
-            cpu_alarm = info['cpu'] > self.alarms.get('cpu', 100)
-            mem_alarm = info['memory_percent'] > self.alarms.get('memory', 100)
-            disk_alarm = info['disk_percent'] > self.alarms.get('disk', 100)
-            cpu_text = f"CPU: {info['cpu']:.1f}% {'ALARM' if cpu_alarm else ''}"
-            mem_text = f"RAM: {info['memory_percent']:.1f}% {'ALARM' if mem_alarm else ''}"
-            disk_text = f"Disk: {info['disk_percent']:.1f}% {'ALARM' if disk_alarm else ''}"
-            draw.text((0, 0), cpu_text, fill="white")
-            draw.text((0, 12), mem_text, fill="white")
-            draw.text((0, 24), f"     {info['memory_used']}MB/{info['memory_total']}MB", fill="white")
-            draw.text((0, 36), disk_text, fill="white")
-            draw.text((0, 48), f"      {info['disk_used']}GB/{info['disk_total']}GB", fill="white")
+            # Only pay for the ALARM suffix on the rare frames it applies
+            cpu_text = 'CPU: ' + self._fmt_pct(info['cpu'])
+            if info['cpu'] > self.alarms.get('cpu', 100):
+                cpu_text += ' ALARM'
+            mem_text = 'RAM: ' + self._fmt_pct(info['memory_percent'])
+            if info['memory_percent'] > self.alarms.get('memory', 100):
+                mem_text += ' ALARM'
+            disk_text = 'Disk: ' + self._fmt_pct(info['disk_percent'])
+            if info['disk_percent'] > self.alarms.get('disk', 100):
+                disk_text += ' ALARM'
+            draw.text((0, 0), cpu_text, fill="white", font=self._font)
+            draw.text((0, 12), mem_text, fill="white", font=self._font)
+            draw.text((0, 24), f"     {info['memory_used']}MB/{info['memory_total']}MB", fill="white", font=self._font)
+            draw.text((0, 36), disk_text, fill="white", font=self._font)
+            draw.text((0, 48), f"      {info['disk_used']}GB/{info['disk_total']}GB", fill="white", font=self._font)
         except Exception as e:
-            draw.text((0, 0), f"Sys Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Sys Error: {str(e)[:15]}", fill="white", font=self._font)
 
     def draw_network_info(self, draw, width, height):
         try:
             info = self.get_network_info()
             if not info:
-                draw.text((0, 0), "Network info unavailable", fill="white")
+                draw.text((0, 0), "Network info unavailable", fill="white", font=self._font)
                 return
-            draw.text((0, 0), "Network Info", fill="white")
+            draw.text((0, 0), "Network Info", fill="white", font=self._font)
             y_pos = 12
             for ip in info['ip_addresses'][:2]:
-                draw.text((0, y_pos), f"IP: {ip}", fill="white")
+                draw.text((0, y_pos), f"IP: {ip}", fill="white", font=self._font)
                 y_pos += 12
-            draw.text((0, y_pos), f"TX: {info['bytes_sent']}MB", fill="white")
-            draw.text((0, y_pos + 12), f"RX: {info['bytes_recv']}MB", fill="white")
+            draw.text((0, y_pos), f"TX: {info['bytes_sent']}MB", fill="white", font=self._font)
+            draw.text((0, y_pos + 12), f"RX: {info['bytes_recv']}MB", fill="white", font=self._font)
         except Exception as e:
-            draw.text((0, 0), f"Net Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Net Error: {str(e)[:15]}", fill="white", font=self._font)
 
     def draw_temperature(self, draw, width, height):
         try:
             temp = self.get_temperature()
-            draw.text((0, 0), "Temperature", fill="white")
+            draw.text((0, 0), "Temperature", fill="white", font=self._font)
             if temp is not None:
-                temp_alarm = temp > self.alarms.get('temperature', 100)
-                temp_text = f"CPU: {temp:.1f}°C {'ALARM' if temp_alarm else ''}"
-                draw.text((0, 20), temp_text, fill="white")
+                temp_text = 'CPU: ' + self._fmt_deg(temp)
+                if temp > self.alarms.get('temperature', 100):
+                    temp_text += ' ALARM'
+                draw.text((0, 20), temp_text, fill="white", font=self._font)
                 if temp < 50:
                     status = "COOL"
                 elif temp < 70:
                     status = "WARM"
                 else:
                     status = "HOT!"
-                draw.text((0, 40), f"Status: {status}", fill="white")
+                draw.text((0, 40), f"Status: {status}", fill="white", font=self._font)
             else:
-                draw.text((0, 20), "Temperature sensor", fill="white")
-                draw.text((0, 32), "not available", fill="white")
+                draw.text((0, 20), "Temperature sensor", fill="white", font=self._font)
+                draw.text((0, 32), "not available", fill="white", font=self._font)
         except Exception as e:
-            draw.text((0, 0), f"Temp Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Temp Error: {str(e)[:15]}", fill="white", font=self._font)
+
+    def _frame_state(self):
+        """Cheap fingerprint of what the active mode would render, or None
+        when the mode should always redraw"""
+        mode = self.display_modes[self.current_mode]
+        try:
+            if mode == 'datetime':
+                now = datetime.now(self.timezone) if PYTZ_AVAILABLE else datetime.now()
+                return (mode, now.strftime("%H:%M:%S"))
+            if mode == 'system_info':
+                info = self.get_system_info()
+                return (mode, tuple(sorted(info.items()))) if info else None
+            if mode == 'temperature':
+                return (mode, self.get_temperature())
+        except Exception:
+            pass
+        return None
+
+    def _dispatch_draw(self, draw):
+        """Render the active mode into the given draw surface"""
+        mode = self.display_modes[self.current_mode]
+        if mode == 'datetime':
+            self.draw_datetime(draw, 128, 64)
+        elif mode == 'system_info':
+            self.draw_system_info(draw, 128, 64)
+        elif mode == 'network_info':
+            self.draw_network_info(draw, 128, 64)
+        elif mode == 'temperature':
+            self.draw_temperature(draw, 128, 64)
 
     def update_display(self):
         try:
             with self.display_lock:
                 if not self.device:
                     return
-                with self.canvas_func(self.device) as draw:
-                    mode = self.display_modes[self.current_mode]
-                    if mode == 'datetime':
-                        self.draw_datetime(draw, 128, 64)
-                    elif mode == 'system_info':
-                        self.draw_system_info(draw, 128, 64)
-                    elif mode == 'network_info':
-                        self.draw_network_info(draw, 128, 64)
-                    elif mode == 'temperature':
-                        self.draw_temperature(draw, 128, 64)
+                # Skip the render and the ~1 KB I2C flush entirely when the
+                # logical content has not changed since the last frame
+                state = self._frame_state()
+                if state is not None and state == self._last_frame_state:
+                    return
+                self._last_frame_state = state
+                if self._img is not None:
+                    # Render into the preallocated buffer and only flush
+                    # when the frame actually differs from the last one
+                    self._draw.rectangle((0, 0, 128, 64), fill=0)
+                    self._dispatch_draw(self._draw)
+                    frame = self._img.tobytes()
+                    if frame != self._last_fb:
+                        self.device.display(self._img)
+                        self._last_fb = frame
+                else:
+                    with self.canvas_func(self.device) as draw:
+                        self._dispatch_draw(draw)
         except Exception as e:
             self.logger.error(f"Display update error: {e}")
 
-    def display_thread(self):
-        while self.running:
-            try:
-                self.auto_ntp_sync()
-                self.update_display()
-                time.sleep(self.config['refresh_rate'])
-            except Exception as e:
-                self.logger.error(f"Display thread error: {e}")
-                time.sleep(5)
-
     def signal_handler(self, signum, frame):
         self.logger.info("Shutdown signal received")
-        self.running = False
+        self._stop.set()
 
     def run(self):
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
-        if os.geteuid() == 0:
+        if self._is_root:
             self.sync_ntp()
         else:
             self.logger.info("Running without root privileges, NTP sync disabled")
-        display_thread = threading.Thread(target=self.display_thread)
-        display_thread.daemon = True
-        display_thread.start()
-        alarm_thread = threading.Thread(target=self.check_time_alarms)
-        alarm_thread.daemon = True
-        alarm_thread.start()
+        scheduler_thread = threading.Thread(target=self.scheduler_loop)
+        scheduler_thread.daemon = True
+        scheduler_thread.start()
+        if self.gpio_initialized:
+            button_thread = threading.Thread(target=self._button_poll)
+            button_thread.daemon = True
+            button_thread.start()
         self.logger.info("NanoPi OLED Monitor started")
         if self.config.get('mock_mode', False):
             self.logger.info("Running in mock mode (no hardware)")
         try:
-            while self.running:
-                time.sleep(1)
+            # Block with no periodic wakeups until a shutdown signal arrives
+            self._stop.wait()
         except KeyboardInterrupt:
             pass
         finally:
@@ -517,7 +836,16 @@ class NanoPiOLEDMonitor:
 
     def cleanup(self):
         self.logger.info("Cleaning up...")
-        self.running = False
+        self._stop.set()
+        # _stop is set, so any in-flight playback drops out at its next
+        # chunk and releases the lock; then the stream can close safely
+        with self._sd_lock:
+            if self._sd_stream is not None:
+                try:
+                    self._sd_stream.close()
+                except:
+                    pass
+                self._sd_stream = None
         if PYGAME_AVAILABLE:
             try:
                 pygame.mixer.quit()
@@ -533,6 +861,11 @@ class NanoPiOLEDMonitor:
                 GPIO.cleanup()
         except:
             pass
+        try:
+            if self._temp_fd is not None:
+                os.close(self._temp_fd)
+        except:
+            pass
         self.logger.info("Cleanup completed")
 
 def install_packages():
@@ -63,28 +63,37 @@ Environment=PYTHONUNBUFFERED=1
 WantedBy=multi-user.target
 """
 
-    # Write service file
+    # Write service file (only when its content actually changed, so
+    # re-running during provisioning skips the systemctl churn)
     service_file = Path("/etc/systemd/system/vcns-timer.service")
     try:
-        with service_file.open("w") as f:
-            f.write(service_content)
-        logger.info(f"Created service file at: {service_file}")
-
-        # Set permissions
-        service_file.chmod(0o644)
-        logger.info(f"Set permissions for {service_file}")
-
-        # Reload systemd daemon
-        subprocess.run(["systemctl", "daemon-reload"], check=True)
-        logger.info("Reloaded systemd daemon")
-
-        # Enable service
-        subprocess.run(["systemctl", "enable", "vcns-timer.service"], check=True)
-        logger.info("Enabled VCNS Timer service")
-
-        # Start service
-        subprocess.run(["systemctl", "start", "vcns-timer.service"], check=True)
-        logger.info("Started VCNS Timer service")
+        existing = service_file.read_text() if service_file.exists() else None
+        if existing != service_content:
+            with service_file.open("w") as f:
+                f.write(service_content)
+            logger.info(f"Created service file at: {service_file}")
+
+            # Set permissions
+            service_file.chmod(0o644)
+            logger.info(f"Set permissions for {service_file}")
+
+            # Reload systemd daemon
+            subprocess.run(["systemctl", "daemon-reload"], check=True)
+            logger.info("Reloaded systemd daemon")
+        else:
+            logger.info(f"Service file unchanged at: {service_file}, skipping daemon-reload")
+
+        # Enable service if not already enabled
+        if subprocess.run(["systemctl", "is-enabled", "--quiet", "vcns-timer.service"],
+                          check=False).returncode != 0:
+            subprocess.run(["systemctl", "enable", "vcns-timer.service"], check=True)
+            logger.info("Enabled VCNS Timer service")
+
+        # Start service if not already running
+        if subprocess.run(["systemctl", "is-active", "--quiet", "vcns-timer.service"],
+                          check=False).returncode != 0:
+            subprocess.run(["systemctl", "start", "vcns-timer.service"], check=True)
+            logger.info("Started VCNS Timer service")
 
         # Check status
         subprocess.run(["systemctl", "status", "vcns-timer.service"], check=False)
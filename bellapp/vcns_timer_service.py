@@ -9,24 +9,42 @@ import sys
 import traceback
 import subprocess
 from pathlib import Path
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response
 import simpleaudio
 import psutil
 from datetime import datetime, timedelta
 import pytz
 import json
+import queue
+import re
 from threading import Lock
-import weakref
+from collections import OrderedDict
 import atexit
+from contextlib import contextmanager
 from functools import wraps
 
+# orjson is optional - fall back to Flask's stdlib json provider if missing
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# waitress is optional - fall back to the Flask dev server if missing
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 # Configure logging with rotation to prevent log files from growing too large
 BASE_DIR = Path(__file__).resolve().parent
 LOG_DIR = BASE_DIR / "logs"
 LOG_FILE = LOG_DIR / "vcns_timer_service.log"
 os.makedirs(LOG_DIR, exist_ok=True)
 
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # Setup rotating log handler (max 5MB per file, keep 3 backup files)
 log_handler = RotatingFileHandler(
@@ -36,36 +54,118 @@ log_handler.setFormatter(
     logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
 
+# Route all records through a queue so emitting threads (alarm loop, watchdog,
+# Flask workers) never block on the disk write; a background listener drains
+# the queue into the rotating file and console handlers.
+_log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[
-        log_handler,
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
+)
+_log_listener = QueueListener(
+    _log_queue, log_handler, logging.StreamHandler()
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("VCNS-Timer-Service")
 
 app = Flask(__name__)
 
+if ORJSON_AVAILABLE:
+    class OrJSONProvider(JSONProvider):
+        """Rust-backed JSON provider so jsonify() skips pure-Python json.dumps"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrJSONProvider(app)
+    logger.info("Using orjson JSON provider")
+
 # Constants
 AUDIO_DIR = BASE_DIR / "static" / "audio"
 ALARMS_FILE = BASE_DIR / "alarms.json"
 CRASH_LOG_FILE = BASE_DIR / "crash.log"
 RING_DURATION = 60  # seconds
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+DAYS_SET = frozenset(DAYS)
+# HH:MM validator; much cheaper than time.strptime per request
+HHMM_RE = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
 MAX_ALARMS = 50  # Prevent memory issues with too many alarms
 MAX_MEMORY_PERCENT = 85  # Trigger cleanup at this memory usage
 MAX_CPU_PERCENT = 95  # Log warning at this CPU usage
 HEALTH_CHECK_INTERVAL = 300  # 5 minutes
 WATCHDOG_TIMEOUT = 600  # 10 minutes
 
+# Child logger with its own handler for the crash file: records still
+# propagate to the main log, but the traceback is only formatted once
+# (logging caches exc_text on the record) instead of per destination
+crash_logger = logging.getLogger("VCNS-Timer-Service.crash")
+_crash_file_handler = logging.FileHandler(CRASH_LOG_FILE, delay=True)
+_crash_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+crash_logger.addHandler(_crash_file_handler)
+
+class ReadWriteLock:
+    """Many concurrent readers or one exclusive writer.
+
+    GET handlers, the checker thread and save_alarms only read ALARMS,
+    so they shouldn't serialize behind each other on a plain mutex.
+    """
+
+    def __init__(self):
+        self._readers = 0
+        self._mutex = Lock()
+        self._writer = Lock()
+
+    @contextmanager
+    def read_lock(self):
+        with self._mutex:
+            self._readers += 1
+            if self._readers == 1:
+                self._writer.acquire()
+        try:
+            yield
+        finally:
+            with self._mutex:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._writer.release()
+
+    @contextmanager
+    def write_lock(self):
+        self._writer.acquire()
+        try:
+            yield
+        finally:
+            self._writer.release()
+
 # Thread-safe alarm storage
 ALARMS = []
-alarms_lock = Lock()
+# Lookup index {(day, "HH:MM"): [alarm, ...]} kept in sync with ALARMS so the
+# checker thread does a single dict lookup instead of scanning the whole list
+ALARM_INDEX = {}
+alarms_lock = ReadWriteLock()
+
+
+def rebuild_alarm_index():
+    """Rebuild ALARM_INDEX from ALARMS. Caller must hold alarms_lock."""
+    ALARM_INDEX.clear()
+    for alarm in ALARMS:
+        key = (alarm.get("day"), alarm.get("time"))
+        ALARM_INDEX.setdefault(key, []).append(alarm)
 
 # Global shutdown flag
 shutdown_flag = threading.Event()
 
+# Set whenever the alarm schedule changes so the checker thread wakes up
+# and recomputes its next firing time instead of polling every second
+reschedule_event = threading.Event()
+
+# Set by request handlers to ask the flusher thread for a disk write
+save_requested = threading.Event()
+
 # Watchdog system
 last_heartbeat = time.time()
 heartbeat_lock = Lock()
@@ -74,27 +174,47 @@ heartbeat_lock = Lock()
 critical_errors = 0
 max_critical_errors = 5
 
-# Sound cache to prevent repeated loading
-sound_cache = weakref.WeakValueDictionary()
+# Bounded LRU of loaded WaveObjects; the old WeakValueDictionary dropped
+# entries as soon as playback finished, so every alarm re-read the file
+SOUND_CACHE_MAX = 16
+sound_cache = OrderedDict()
 cache_lock = Lock()
 
 # Initialize audio availability
 AUDIO_AVAILABLE = True
 
+# Handle to our own process; stable for the process lifetime, so cache it
+# instead of reopening /proc/self/* on every /api/status poll
+SELF_PROCESS = psutil.Process()
+PROCESS_CREATE_TIME = SELF_PROCESS.create_time()
+
 def startup_checks():
     """Perform startup validation"""
     try:
+        # Prime the non-blocking CPU counter so later interval=None
+        # readings have a baseline to diff against
+        psutil.cpu_percent(interval=None)
         os.makedirs(AUDIO_DIR, exist_ok=True)
         if not AUDIO_DIR.is_dir():
             logger.critical(f"Audio directory {AUDIO_DIR} is not a directory")
             sys.exit(1)
-        if not any(AUDIO_DIR.iterdir()):
+        # scandir DirEntry objects carry cached stat info, unlike the
+        # Path objects iterdir() builds per file
+        with os.scandir(AUDIO_DIR) as entries:
+            audio_entries = list(entries)
+        if not audio_entries:
             logger.warning(f"No audio files found in {AUDIO_DIR}")
         else:
             # Check for at least one valid .wav file
-            wav_files = [f for f in AUDIO_DIR.iterdir() if f.suffix.lower() == '.wav']
+            wav_files = [e.path for e in audio_entries
+                         if e.name.lower().endswith('.wav') and e.is_file()]
             if not wav_files:
                 logger.warning(f"No .wav files found in {AUDIO_DIR}. simpleaudio requires .wav files.")
+            else:
+                # Warm the cache so the first alarm doesn't pay the load cost
+                for wav_file in wav_files[:SOUND_CACHE_MAX]:
+                    get_cached_sound(wav_file)
+                logger.info(f"Preloaded {min(len(wav_files), SOUND_CACHE_MAX)} sound files")
     except Exception as e:
         logger.critical(f"Startup checks failed: {e}")
         sys.exit(1)
@@ -108,16 +228,16 @@ def crash_handler(func):
             return func(*args, **kwargs)
         except Exception as e:
             critical_errors += 1
-            error_msg = f"CRITICAL ERROR in {func.__name__}: {str(e)}\n{traceback.format_exc()}"
-            logger.critical(error_msg)
-            
-            # Log to crash file
+            # exc_info=True lets logging walk the stack lazily (and only
+            # once) rather than eagerly via traceback.format_exc(); the
+            # crash_logger handler mirrors the record into the crash file
             try:
-                with open(CRASH_LOG_FILE, 'a') as f:
-                    f.write(f"{datetime.now().isoformat()} - {error_msg}\n")
+                crash_logger.critical(
+                    "CRITICAL ERROR in %s: %s", func.__name__, e, exc_info=True
+                )
             except:
                 pass  # Don't crash while logging a crash
-            
+
             # If too many critical errors, trigger emergency save and restart
             if critical_errors >= max_critical_errors:
                 emergency_save_and_restart()
@@ -206,8 +326,10 @@ def load_alarms():
         if ALARMS_FILE.exists():
             with open(ALARMS_FILE, 'r') as f:
                 data = json.load(f)
-                with alarms_lock:
+                with alarms_lock.write_lock():
                     ALARMS = data.get('alarms', [])
+                    rebuild_alarm_index()
+                reschedule_event.set()
                 logger.info(f"Loaded {len(ALARMS)} alarms from file")
         else:
             logger.info("No existing alarms file found")
@@ -217,44 +339,60 @@ def load_alarms():
 
 @crash_handler
 def save_alarms():
-    """Save alarms to persistent storage"""
+    """Save alarms to persistent storage (atomic temp write + os.replace)"""
     try:
-        # Create backup first
-        if ALARMS_FILE.exists():
-            backup_file = ALARMS_FILE.with_suffix('.bak')
-            ALARMS_FILE.rename(backup_file)
-        
-        with alarms_lock:
-            data = {'alarms': ALARMS}
-        
-        # Write to temporary file first, then rename (atomic operation)
+        with alarms_lock.read_lock():
+            if ORJSON_AVAILABLE:
+                buf = orjson.dumps({'alarms': ALARMS}, option=orjson.OPT_INDENT_2)
+            else:
+                buf = json.dumps({'alarms': ALARMS}, indent=2).encode()
+
         temp_file = ALARMS_FILE.with_suffix('.tmp')
-        with open(temp_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        temp_file.rename(ALARMS_FILE)
+        with open(temp_file, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, ALARMS_FILE)
         logger.debug("Alarms saved to file")
     except Exception as e:
         logger.error(f"Failed to save alarms: {e}")
-        # Try to restore backup if it exists
-        backup_file = ALARMS_FILE.with_suffix('.bak')
-        if backup_file.exists():
-            backup_file.rename(ALARMS_FILE)
-            logger.info("Restored alarms from backup")
+
+def request_save():
+    """Queue a save; the flusher thread coalesces bursts into one write"""
+    save_requested.set()
+
+def save_flusher_thread():
+    """Persist ALARMS at most once per second no matter how fast edits arrive"""
+    logger.info("Save flusher thread started")
+    while not shutdown_flag.is_set():
+        save_requested.wait()
+        if shutdown_flag.is_set():
+            break
+        # Let rapid-fire edits accumulate before hitting the disk
+        shutdown_flag.wait(1)
+        save_requested.clear()
+        save_alarms()
+    logger.info("Save flusher thread stopped")
 
 @crash_handler
 def get_cached_sound(sound_path):
     """Get sound from cache or load it"""
+    key = str(sound_path)
     with cache_lock:
-        sound = sound_cache.get(str(sound_path))
-        if sound is None:
-            try:
-                sound = simpleaudio.WaveObject.from_wave_file(str(sound_path))
-                sound_cache[str(sound_path)] = sound
-                logger.debug(f"Cached sound: {sound_path}")
-            except Exception as e:
-                logger.error(f"Failed to load sound {sound_path}: {e}")
-                return None
+        sound = sound_cache.get(key)
+        if sound is not None:
+            sound_cache.move_to_end(key)
+            return sound
+        try:
+            sound = simpleaudio.WaveObject.from_wave_file(key)
+        except Exception as e:
+            logger.error(f"Failed to load sound {sound_path}: {e}")
+            return None
+        sound_cache[key] = sound
+        if len(sound_cache) > SOUND_CACHE_MAX:
+            evicted, _ = sound_cache.popitem(last=False)
+            logger.debug(f"Evicted sound from cache: {evicted}")
+        logger.debug(f"Cached sound: {sound_path}")
         return sound
 
 @crash_handler
@@ -274,22 +412,32 @@ def play_sound(sound_path):
             return
             
         play_obj = sound.play()
-        start_time = time.time()
-        while play_obj.is_playing() and time.time() - start_time < RING_DURATION:
-            if shutdown_flag.is_set():
-                break
-            time.sleep(0.1)
-            
-        if play_obj.is_playing():
-            play_obj.stop()
-            logger.info(f"Sound stopped after {RING_DURATION}s")
-        else:
+
+        # Cap the ring length without polling is_playing() every 100ms
+        stop_timer = threading.Timer(RING_DURATION, play_obj.stop)
+        stop_timer.daemon = True
+        stop_timer.start()
+
+        # Cut playback short if the service shuts down mid-ring
+        def stop_on_shutdown():
+            if shutdown_flag.wait(RING_DURATION):
+                play_obj.stop()
+
+        threading.Thread(
+            target=stop_on_shutdown, daemon=True, name="SoundShutdownWatch"
+        ).start()
+
+        play_obj.wait_done()
+
+        if stop_timer.is_alive():
+            stop_timer.cancel()
             logger.info("Sound completed naturally")
+        else:
+            logger.info(f"Sound stopped after {RING_DURATION}s")
             
     except Exception as e:
         logger.error(f"Sound playback failed: {e}")
     finally:
-        gc.collect()
         update_heartbeat()
 
 @crash_handler
@@ -297,8 +445,10 @@ def check_system_resources():
     """Monitor system resources and log warnings if getting low"""
     try:
         memory = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent(interval=1)
-        
+        # interval=None returns usage since the previous call without
+        # blocking the alarm thread for a second
+        cpu_percent = psutil.cpu_percent(interval=None)
+
         if memory.percent > MAX_MEMORY_PERCENT:
             logger.warning(f"High memory usage: {memory.percent:.1f}%")
             force_cleanup()
@@ -314,72 +464,103 @@ def check_system_resources():
     except Exception as e:
         logger.error(f"Failed to check system resources: {e}")
 
+def seconds_until_next_alarm(now):
+    """Seconds until the next scheduled alarm after `now` (tz-aware).
+
+    Caller must hold alarms_lock. Returns None when no alarms exist.
+    """
+    next_fire = None
+    for day, hhmm in ALARM_INDEX:
+        try:
+            day_index = DAYS.index(day)
+            hour, minute = map(int, hhmm.split(":"))
+        except (ValueError, AttributeError, TypeError):
+            continue
+        days_ahead = (day_index - now.weekday()) % 7
+        fire = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        fire += timedelta(days=days_ahead)
+        if fire <= now:
+            fire += timedelta(days=7)
+        if next_fire is None or fire < next_fire:
+            next_fire = fire
+    if next_fire is None:
+        return None
+    return (next_fire - now).total_seconds()
+
 @crash_handler
 def check_alarms():
-    """Main alarm checking loop with improved error handling"""
+    """Main alarm checking loop: sleeps until the next scheduled firing"""
     logger.info("Alarm checking thread started")
     last_minute = None
-    health_check_counter = 0
-    
+    next_health_check = time.time() + HEALTH_CHECK_INTERVAL
+
+    # Wake at least this often to refresh the watchdog heartbeat (timeout
+    # is 600s) and run the periodic resource checks
+    max_wait = 300.0
+
     while not shutdown_flag.is_set():
         try:
             now = datetime.now(pytz.UTC)
-            current_minute = now.strftime("%Y-%m-%d %H:%M")
-            
+            # strftime is locale-aware and parses its format string per
+            # call; plain attribute access is enough to key the minute
+            current_minute = (now.year, now.month, now.day, now.hour, now.minute)
+
             # Update heartbeat
             update_heartbeat()
-            
-            # Only process if we're in a new minute to prevent duplicate triggers
+
+            # Guard against double-firing when woken twice in the same minute
             if current_minute != last_minute:
                 last_minute = current_minute
-                current_day = now.strftime("%A")
-                current_time = now.strftime("%H:%M")
-                
-                # Periodic health checks
-                health_check_counter += 1
-                if health_check_counter >= 5:  # Every 5 minutes
-                    check_system_resources()
-                    health_check_counter = 0
-                
-                with alarms_lock:
-                    alarms_to_check = ALARMS.copy()
-                
-                for i, alarm in enumerate(alarms_to_check):
+                current_day = DAYS[now.weekday()]
+                current_time = f"{now.hour:02d}:{now.minute:02d}"
+
+                with alarms_lock.read_lock():
+                    due_alarms = list(ALARM_INDEX.get((current_day, current_time), ()))
+
+                for i, alarm in enumerate(due_alarms):
                     if shutdown_flag.is_set():
                         break
-                        
+
                     try:
-                        if alarm.get("day") == current_day and alarm.get("time") == current_time:
-                            sound_path = BASE_DIR / alarm.get("sound", "")
-                            if sound_path.exists():
-                                logger.info(f"Triggering alarm {i}: {alarm}")
-                                sound_thread = threading.Thread(
-                                    target=play_sound, 
-                                    args=(sound_path,), 
-                                    daemon=True,
-                                    name=f"SoundPlayer-{i}"
-                                )
-                                sound_thread.start()
-                            else:
-                                logger.error(f"Sound file missing for alarm {i}: {sound_path}")
+                        sound_path = BASE_DIR / alarm.get("sound", "")
+                        if sound_path.exists():
+                            logger.info(f"Triggering alarm: {alarm}")
+                            sound_thread = threading.Thread(
+                                target=play_sound,
+                                args=(sound_path,),
+                                daemon=True,
+                                name=f"SoundPlayer-{i}"
+                            )
+                            sound_thread.start()
+                        else:
+                            logger.error(f"Sound file missing for alarm {alarm}: {sound_path}")
                     except Exception as e:
-                        logger.error(f"Error processing alarm {i}: {e}")
-                        
+                        logger.error(f"Error processing alarm {alarm}: {e}")
+
+            # Periodic health checks
+            if time.time() >= next_health_check:
+                check_system_resources()
+                next_health_check = time.time() + HEALTH_CHECK_INTERVAL
+
+            # Sleep until the next scheduled alarm (or schedule change)
+            with alarms_lock.read_lock():
+                delay = seconds_until_next_alarm(datetime.now(pytz.UTC))
+            timeout = max_wait if delay is None else min(max(delay, 0.0), max_wait)
+            reschedule_event.wait(timeout)
+            reschedule_event.clear()
+
         except Exception as e:
             logger.error(f"Error in alarm checking loop: {e}")
-            
-        # Sleep for 30 seconds instead of 60 for more responsive checking
-        for _ in range(30):
-            if shutdown_flag.is_set():
-                break
-            time.sleep(1)
-    
+            shutdown_flag.wait(5)
+
     logger.info("Alarm checking thread stopped")
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully"""
     logger.info(f"Received signal {signum}, shutting down...")
     shutdown_flag.set()
+    reschedule_event.set()
+    save_requested.set()
     save_alarms()
     sys.exit(0)
 
@@ -396,21 +577,20 @@ atexit.register(cleanup_on_exit)
 @app.route("/api/status", methods=["GET"])
 def status():
     try:
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        cpu_percent = process.cpu_percent()
-        
+        memory_info = SELF_PROCESS.memory_info()
+        cpu_percent = SELF_PROCESS.cpu_percent()
+
         system_memory = psutil.virtual_memory()
-        
+
         return jsonify({
             "status": "Running",
-            "pid": process.pid,
+            "pid": SELF_PROCESS.pid,
             "memory_mb": round(memory_info.rss / 1024 / 1024, 2),
             "cpu_percent": cpu_percent,
             "system_memory_percent": system_memory.percent,
             "alarm_count": len(ALARMS),
             "audio_available": AUDIO_AVAILABLE,
-            "uptime_seconds": int(time.time() - process.create_time()),
+            "uptime_seconds": int(time.time() - PROCESS_CREATE_TIME),
             "critical_errors": critical_errors,
             "last_heartbeat": last_heartbeat,
             "watchdog_active": True
@@ -421,8 +601,14 @@ def status():
 
 @app.route("/api/alarms", methods=["GET"])
 def get_alarms():
-    with alarms_lock:
-        return jsonify({"alarms": ALARMS.copy()})
+    # Serialize directly under the read lock instead of copying the list;
+    # the dump takes microseconds so the lock hold time stays tiny
+    with alarms_lock.read_lock():
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps({"alarms": ALARMS})
+        else:
+            body = json.dumps({"alarms": ALARMS})
+    return Response(body, mimetype="application/json")
 
 @app.route("/api/alarms", methods=["POST"])
 def add_alarm():
@@ -432,17 +618,13 @@ def add_alarm():
             logger.error("Invalid alarm data")
             return jsonify({"error": "Missing required fields: day, time, sound"}), 400
 
-        with alarms_lock:
-            if len(ALARMS) >= MAX_ALARMS:
-                return jsonify({"error": f"Maximum {MAX_ALARMS} alarms allowed"}), 400
-
-        if data["day"] not in DAYS:
+        # Validate everything (including the filesystem checks) before
+        # touching the lock so it is only held for the append itself
+        if data["day"] not in DAYS_SET:
             logger.error(f"Invalid day: {data['day']}")
             return jsonify({"error": "Invalid day"}), 400
 
-        try:
-            time.strptime(data["time"], "%H:%M")
-        except ValueError:
+        if not HHMM_RE.match(data["time"]):
             logger.error(f"Invalid time format: {data['time']}")
             return jsonify({"error": "Invalid time format (use HH:MM)"}), 400
 
@@ -460,11 +642,15 @@ def add_alarm():
             "label": data.get("label", "Alarm"),
             "sound": data["sound"]
         }
-        
-        with alarms_lock:
+
+        with alarms_lock.write_lock():
+            if len(ALARMS) >= MAX_ALARMS:
+                return jsonify({"error": f"Maximum {MAX_ALARMS} alarms allowed"}), 400
             ALARMS.append(alarm)
-        
-        save_alarms()
+            ALARM_INDEX.setdefault((alarm["day"], alarm["time"]), []).append(alarm)
+        reschedule_event.set()
+
+        request_save()
         logger.info(f"Added alarm: {alarm}")
         return jsonify({"message": "Alarm added", "alarm": alarm}), 201
         
@@ -475,23 +661,16 @@ def add_alarm():
 @app.route("/api/alarms/<int:index>", methods=["PUT"])
 def edit_alarm(index):
     try:
-        with alarms_lock:
-            if index < 0 or index >= len(ALARMS):
-                logger.error(f"Invalid alarm index: {index}")
-                return jsonify({"error": "Alarm not found"}), 404
-
         data = request.get_json()
         if not data or not all(key in data for key in ["day", "time", "sound"]):
             logger.error("Invalid alarm data")
             return jsonify({"error": "Missing required fields: day, time, sound"}), 400
 
-        if data["day"] not in DAYS:
+        if data["day"] not in DAYS_SET:
             logger.error(f"Invalid day: {data['day']}")
             return jsonify({"error": "Invalid day"}), 400
 
-        try:
-            time.strptime(data["time"], "%H:%M")
-        except ValueError:
+        if not HHMM_RE.match(data["time"]):
             logger.error(f"Invalid time format: {data['time']}")
             return jsonify({"error": "Invalid time format (use HH:MM)"}), 400
 
@@ -510,10 +689,15 @@ def edit_alarm(index):
             "sound": data["sound"]
         }
         
-        with alarms_lock:
+        with alarms_lock.write_lock():
+            if index < 0 or index >= len(ALARMS):
+                logger.error(f"Invalid alarm index: {index}")
+                return jsonify({"error": "Alarm not found"}), 404
             ALARMS[index] = updated_alarm
-        
-        save_alarms()
+            rebuild_alarm_index()
+        reschedule_event.set()
+
+        request_save()
         logger.info(f"Updated alarm at index {index}: {updated_alarm}")
         return jsonify({"message": "Alarm updated", "alarm": updated_alarm})
         
@@ -524,14 +708,16 @@ def edit_alarm(index):
 @app.route("/api/alarms/<int:index>", methods=["DELETE"])
 def delete_alarm(index):
     try:
-        with alarms_lock:
+        with alarms_lock.write_lock():
             if index < 0 or index >= len(ALARMS):
                 logger.error(f"Invalid alarm index: {index}")
                 return jsonify({"error": "Alarm not found"}), 404
 
             alarm = ALARMS.pop(index)
-        
-        save_alarms()
+            rebuild_alarm_index()
+        reschedule_event.set()
+
+        request_save()
         logger.info(f"Deleted alarm: {alarm}")
         return jsonify({"message": "Alarm deleted"})
         
@@ -639,21 +825,28 @@ if __name__ == "__main__":
         
         alarm_thread = threading.Thread(target=check_alarms, daemon=True, name="AlarmChecker")
         alarm_thread.start()
+
+        save_thread = threading.Thread(target=save_flusher_thread, daemon=True, name="SaveFlusher")
+        save_thread.start()
         
-        logger.info("Starting Flask service on 0.0.0.0:5001")
         logger.info(f"Watchdog timeout: {WATCHDOG_TIMEOUT}s")
         logger.info(f"Max critical errors: {max_critical_errors}")
-        
+
         update_heartbeat()
-        
-        app.run(
-            host="0.0.0.0", 
-            port=5001, 
-            debug=False, 
-            threaded=True,
-            use_reloader=False,
-            processes=1
-        )
+
+        if WAITRESS_AVAILABLE:
+            logger.info("Starting waitress server on 0.0.0.0:5001")
+            waitress_serve(app, host="0.0.0.0", port=5001, threads=8)
+        else:
+            logger.warning("waitress not installed - using Flask dev server")
+            app.run(
+                host="0.0.0.0",
+                port=5001,
+                debug=False,
+                threaded=True,
+                use_reloader=False,
+                processes=1
+            )
         
     except KeyboardInterrupt:
         logger.info("Service interrupted by user")
@@ -3,13 +3,47 @@
 Flask web UI for setting time-based alarms in NanoPi OLED Monitor
 """
 from flask import Flask, render_template, request, jsonify, send_from_directory
+from werkzeug.utils import secure_filename
 from pathlib import Path
 import json
 import logging
 import os
+import re
+import shutil
+import threading
+
+# waitress is optional - fall back to the Flask dev server if missing
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# orjson is optional - fall back to Flask's stdlib json provider if missing
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 app = Flask(__name__)
 
+if ORJSON_AVAILABLE:
+    class OrJSONProvider(JSONProvider):
+        """Rust-backed JSON provider so jsonify() skips pure-Python json.dumps"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrJSONProvider(app)
+
+# Reject oversize uploads before they are read into memory
+app.config['MAX_CONTENT_LENGTH'] = 25 * 1024 * 1024
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +58,9 @@ logger = logging.getLogger(__name__)
 CONFIG_FILE = Path.home() / '.nanopi_monitor_config.json'
 SOUND_DIR = Path.home() / '.nanopi_sounds'
 
+# HH:MM validator; much cheaper than datetime.strptime per request
+HHMM_RE = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+
 def ensure_sound_dir():
     """Ensure the sound directory exists with correct permissions"""
     try:
@@ -34,26 +71,71 @@ def ensure_sound_dir():
         logger.error(f"Failed to create sound directory {SOUND_DIR}: {e}")
         raise
 
+# In-memory config cache so every render/save doesn't re-read and
+# re-parse the file; invalidated when the mtime on disk changes
+_config_cache = None
+_config_mtime = None
+_config_lock = threading.Lock()
+
 def load_config():
-    """Load configuration from file"""
+    """Load configuration, reparsing only when the file changed on disk"""
+    global _config_cache, _config_mtime
     default_config = {
         'timezone': 'Africa/Johannesburg',
-        'time_alarms': []
+        'time_alarms': {}
     }
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                default_config.update(config)
-        except Exception as e:
-            logger.error(f"Could not load config: {e}")
-    return default_config
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime
+    except OSError:
+        mtime = None
+    with _config_lock:
+        if _config_cache is not None and mtime == _config_mtime:
+            return _config_cache
+        config = default_config
+        if mtime is not None:
+            try:
+                raw = CONFIG_FILE.read_bytes()
+                if ORJSON_AVAILABLE:
+                    config.update(orjson.loads(raw))
+                else:
+                    config.update(json.loads(raw))
+            except Exception as e:
+                logger.error(f"Could not load config: {e}")
+        # Key alarms by time in memory so edits and deletes are O(1);
+        # the on-disk file keeps the list format other consumers expect
+        alarms = config.get('time_alarms')
+        if isinstance(alarms, list):
+            config['time_alarms'] = {
+                alarm['time']: {'sound': alarm.get('sound'),
+                                'enabled': alarm.get('enabled', True)}
+                for alarm in alarms if 'time' in alarm
+            }
+        _config_cache = config
+        _config_mtime = mtime
+        return config
+
+def alarms_as_list(config):
+    """Flatten the in-memory alarm dict back to the list shape used on
+    disk and in the template"""
+    return [{'time': alarm_time, **alarm}
+            for alarm_time, alarm in config['time_alarms'].items()]
 
 def save_config(config):
-    """Save configuration to file"""
+    """Save configuration to file (atomic temp write + os.replace)"""
+    global _config_cache, _config_mtime
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        data = dict(config)
+        data['time_alarms'] = alarms_as_list(config)
+        if ORJSON_AVAILABLE:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            buf = json.dumps(data, indent=2).encode()
+        temp_file = CONFIG_FILE.with_suffix('.tmp')
+        temp_file.write_bytes(buf)
+        os.replace(temp_file, CONFIG_FILE)
+        with _config_lock:
+            _config_cache = config
+            _config_mtime = CONFIG_FILE.stat().st_mtime
         logger.info("Alarm settings saved successfully")
         return True
     except Exception as e:
@@ -65,8 +147,9 @@ def index():
     """Render the main UI"""
     ensure_sound_dir()
     config = load_config()
-    sounds = [f.name for f in SOUND_DIR.iterdir() if f.suffix.lower() in ['.mp3', '.wav']]
-    return render_template('index.html', alarms=config['time_alarms'], sounds=sounds)
+    sounds = [e.name for e in os.scandir(SOUND_DIR)
+              if e.name.lower().endswith(('.mp3', '.wav')) and e.is_file()]
+    return render_template('index.html', alarms=alarms_as_list(config), sounds=sounds)
 
 @app.route('/save_alarm', methods=['POST'])
 def save_alarm():
@@ -77,24 +160,14 @@ def save_alarm():
         sound = data.get('sound')
         enabled = data.get('enabled', True)
         # Validate time format (HH:MM)
-        try:
-            from datetime import datetime
-            datetime.strptime(time, '%H:%M')
-        except ValueError:
+        if not time or not HHMM_RE.match(time):
             return jsonify({'error': 'Invalid time format (use HH:MM)'}), 400
         # Validate sound file
         if not (SOUND_DIR / sound).exists():
             return jsonify({'error': 'Selected sound file not found'}), 400
         config = load_config()
-        # Update or add alarm
-        alarms = config['time_alarms']
-        for alarm in alarms:
-            if alarm['time'] == time:
-                alarm.update({'sound': sound, 'enabled': enabled})
-                break
-        else:
-            alarms.append({'time': time, 'sound': sound, 'enabled': enabled})
-        config['time_alarms'] = alarms
+        # Update or add alarm - single dict assignment either way
+        config['time_alarms'][time] = {'sound': sound, 'enabled': enabled}
         logger.info(f"Saving alarm: {time} with {sound}")
         if save_config(config):
             return jsonify({'message': 'Alarm saved successfully'})
@@ -109,7 +182,7 @@ def delete_alarm(time):
     """Delete an alarm"""
     try:
         config = load_config()
-        config['time_alarms'] = [alarm for alarm in config['time_alarms'] if alarm['time'] != time]
+        config['time_alarms'].pop(time, None)
         logger.info(f"Deleting alarm: {time}")
         if save_config(config):
             return jsonify({'message': 'Alarm deleted successfully'})
@@ -133,9 +206,15 @@ def upload_sound():
             return jsonify({'error': 'No file selected'}), 400
         if file and file.filename.lower().endswith(('.mp3', '.wav')):
             # Sanitize filename
-            filename = file.filename.replace('/', '_').replace('\\', '_')
+            filename = secure_filename(file.filename)
+            if not filename:
+                logger.warning(f"Filename rejected: {file.filename}")
+                return jsonify({'error': 'Invalid filename'}), 400
             file_path = SOUND_DIR / filename
-            file.save(file_path)
+            # Stream to disk in fixed-size chunks instead of buffering
+            # the whole upload in memory
+            with open(file_path, 'wb') as out:
+                shutil.copyfileobj(file.stream, out, length=65536)
             # Verify file was saved
             if file_path.exists():
                 logger.info(f"Sound file saved: {filename} at {file_path}")
@@ -154,11 +233,18 @@ def upload_sound():
 def serve_sound(filename):
     """Serve sound files"""
     try:
-        return send_from_directory(SOUND_DIR, filename)
+        # conditional=True lets Flask answer repeat fetches with 304s
+        # (ETag/If-Modified-Since); max_age keeps plays in browser cache
+        return send_from_directory(SOUND_DIR, filename,
+                                   conditional=True, max_age=86400)
     except Exception as e:
         logger.error(f"Error serving sound {filename}: {e}")
         return jsonify({'error': 'File not found'}), 404
 
 if __name__ == '__main__':
-    logger.info("Starting Flask web UI on http://0.0.0.0:5000")
-    app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
+    if WAITRESS_AVAILABLE:
+        logger.info("Starting web UI with waitress on http://0.0.0.0:5000")
+        waitress_serve(app, host='0.0.0.0', port=5000, threads=8)
+    else:
+        logger.info("Starting Flask web UI on http://0.0.0.0:5000")
+        app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
@@ -7,29 +7,80 @@
 import os
 import subprocess
 import json
+import hashlib
 import logging
+import queue
+import socket
+import atexit
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from uuid import uuid4
+from logging.handlers import QueueHandler, QueueListener
 from flask import Flask, request, jsonify
+
+# orjson is optional - fall back to Flask's stdlib json handling if missing
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# waitress is optional - fall back to the Flask dev server if missing
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
 from datetime import datetime
 import ipaddress # For CIDR conversion
-import yaml # For YAML manipulation (install with pip install pyyaml)
-import time # For sleep
-from pathlib import Path
+import time # For the interface-cache TTL
 
 # --- Logging Configuration ---
 LOG_FILE = '/var/log/ubuntu_config_service.log'
 
+# Emitting threads only enqueue records; a background listener drains
+# them into the file and console handlers so request handlers never
+# block on a write() to /var/log.
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger('UbuntuConfigService')
 
 app = Flask(__name__)
 
+if ORJSON_AVAILABLE:
+    class OrJSONProvider(JSONProvider):
+        """Rust-backed JSON provider so jsonify() skips pure-Python json.dumps"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrJSONProvider(app)
+
+def _request_json():
+    """Parse the request body, bypassing Flask's mimetype plumbing when
+    orjson is available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(request.get_data())
+        except orjson.JSONDecodeError:
+            return None
+    return request.get_json(silent=True)
+
 # --- Docker Test Mode Flag ---
 # This environment variable will be set in docker-compose.dev.yml for testing purposes.
 # When True, timedatectl and netplan commands will be mocked.
@@ -42,6 +93,213 @@ NETPLAN_CONFIG_DIR = '/etc/netplan/'
 NETPLAN_CONFIG_FILE = os.path.join(NETPLAN_CONFIG_DIR, '01-vcns-network.yaml') # Dedicated config file
 DEFAULT_NTP_SERVER = 'pool.ntp.org' # Default NTP server if none provided
 
+# Ensure the Netplan config directory exists once at import, so no
+# request handler ever has to re-check it and the guarantee also holds
+# when the app is served by an external WSGI runner instead of __main__.
+try:
+    os.makedirs(NETPLAN_CONFIG_DIR, exist_ok=True)
+except OSError as _e:
+    logger.warning(f"Could not create {NETPLAN_CONFIG_DIR}: {_e}")
+
+# All 33 dotted-quad netmasks precomputed once, so the per-request
+# mask-to-CIDR conversion is a dict lookup rather than an IPv4Network
+# construction.
+_MASK_TO_CIDR = {
+    str(ipaddress.IPv4Network((0, prefix)).netmask): prefix
+    for prefix in range(33)
+}
+
+def _valid_ip(address):
+    """Cheap dotted-quad check via inet_aton (one C call, no objects)."""
+    try:
+        socket.inet_aton(address)
+        return True
+    except (OSError, TypeError):
+        return False
+
+# The schema this service writes is small and fixed, so the YAML is
+# rendered from string templates; formatting two placeholders replaces
+# the dict-build + PyYAML emit round trip. Inputs must be validated
+# before formatting so the output stays well-formed YAML.
+_DHCP_TPL = (
+    "network:\n"
+    "  version: 2\n"
+    "  renderer: networkd\n"
+    "  ethernets:\n"
+    "    {iface}:\n"
+    "      dhcp4: true\n"
+)
+_STATIC_TPL = (
+    "network:\n"
+    "  version: 2\n"
+    "  renderer: networkd\n"
+    "  ethernets:\n"
+    "    {iface}:\n"
+    "      dhcp4: false\n"
+    "      addresses: [{addr}]\n"
+    "      routes:\n"
+    "        - to: default\n"
+    "          via: {gw}\n"
+    "      nameservers:\n"
+    "        addresses: [{dns}]\n"
+)
+
+@functools.lru_cache(maxsize=32)
+def _generate_netplan_yaml(interface, dhcp4, address_cidr=None, gateway=None, dns_server=None):
+    """Render netplan YAML for the fixed schema this service manages.
+
+    Memoized: all arguments are hashable scalars and the rendered
+    string is immutable, so monitoring-style clients that re-post the
+    same settings get it straight from the cache. The interface name is
+    part of the key, so a changed interface after the detection TTL
+    expires naturally produces a fresh entry.
+    """
+    if dhcp4:
+        return _DHCP_TPL.format(iface=interface)
+    return _STATIC_TPL.format(iface=interface, addr=address_cidr,
+                              gw=gateway, dns=dns_server)
+
+# Digests of the last netplan YAML written to disk and of the last one
+# successfully applied, seeded from the file so the short-circuit
+# survives service restarts. netplan apply is multi-second work;
+# re-posting an identical config skips it - but only when both hashes
+# agree, i.e. the on-disk file really is the config that took effect.
+# After a failed apply the hashes diverge, so re-posting either the bad
+# config (retry) or the last-good one (rollback rewrite) still runs.
+def _hash_yaml(yaml_content):
+    return hashlib.blake2b(yaml_content.encode(), digest_size=16).digest()
+
+try:
+    with open(NETPLAN_CONFIG_FILE, 'rb') as _f:
+        _LAST_WRITTEN_HASH = hashlib.blake2b(_f.read(), digest_size=16).digest()
+except OSError:
+    _LAST_WRITTEN_HASH = None
+# Whatever was on disk at startup was applied at boot
+_LAST_APPLIED_HASH = _LAST_WRITTEN_HASH
+
+# --- Background netplan apply ---
+# netplan apply can block for several seconds while systemd-networkd
+# converges; a single-worker executor runs it off the request thread
+# and serializes concurrent applies. Completed jobs are kept for a
+# while so clients can poll /jobs/<id>.
+_APPLY_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_JOBS = {}
+_JOBS_LOCK = threading.Lock()
+_JOB_TTL = 300.0
+
+def _sweep_jobs_locked(now):
+    """Drop completed jobs older than _JOB_TTL. Caller holds _JOBS_LOCK."""
+    expired = [job_id for job_id, job in _JOBS.items()
+               if job['future'].done() and now - job['created'] > _JOB_TTL]
+    for job_id in expired:
+        del _JOBS[job_id]
+
+def _apply_netplan_job(new_hash):
+    """Run netplan apply and record the new config hash on success."""
+    global _LAST_APPLIED_HASH
+    success, error = run_command(['netplan', 'apply'])
+    if success:
+        _LAST_APPLIED_HASH = new_hash
+        logger.info("Network settings applied successfully.")
+    else:
+        logger.error(f"Netplan apply failed: {error}")
+    return success, error
+
+# --- timedate1 D-Bus Access ---
+# pydbus is optional. When present, time settings go to
+# org.freedesktop.timedate1 over one persistent system-bus connection
+# instead of fork+exec'ing timedatectl for every call.
+try:
+    import pydbus
+    PYDBUS_AVAILABLE = True
+except ImportError:
+    PYDBUS_AVAILABLE = False
+
+_timedate1 = None
+
+def _get_timedate1():
+    """Return a cached proxy for org.freedesktop.timedate1, or None."""
+    global _timedate1
+    if not PYDBUS_AVAILABLE or IN_DOCKER_TEST_MODE:
+        return None
+    if _timedate1 is None:
+        try:
+            _timedate1 = pydbus.SystemBus().get('.timedate1')
+        except Exception as e:
+            logger.warning(f"Could not connect to timedate1 over D-Bus: {e}")
+            return None
+    return _timedate1
+
+def _set_timezone(timezone):
+    """Set the system timezone via D-Bus, falling back to timedatectl."""
+    timedate1 = _get_timedate1()
+    if timedate1 is not None:
+        try:
+            timedate1.SetTimezone(timezone, False)
+            return True, ""
+        except Exception as e:
+            logger.warning(f"D-Bus SetTimezone failed, falling back to timedatectl: {e}")
+    return run_command(['timedatectl', 'set-timezone', timezone])
+
+def _set_ntp(enabled):
+    """Enable/disable NTP sync via D-Bus, falling back to timedatectl."""
+    timedate1 = _get_timedate1()
+    if timedate1 is not None:
+        try:
+            timedate1.SetNTP(bool(enabled), False)
+            return True, ""
+        except Exception as e:
+            logger.warning(f"D-Bus SetNTP failed, falling back to timedatectl: {e}")
+    return run_command(['timedatectl', 'set-ntp', 'true' if enabled else 'false'])
+
+def _parse_manual_datetime(manual_date, manual_time):
+    """Parse 'YYYY-MM-DD' + 'HH:MM' into a datetime, or None if invalid.
+
+    The format is fixed, so split-and-int beats datetime.strptime,
+    which rebuilds a regex behind a shared lock on every call.
+    """
+    try:
+        year, month, day = map(int, manual_date.split('-'))
+        hour, minute = map(int, manual_time.split(':'))
+        return datetime(year, month, day, hour, minute)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+def _set_time(dt):
+    """Set the wall clock via D-Bus, falling back to timedatectl."""
+    timedate1 = _get_timedate1()
+    if timedate1 is not None:
+        try:
+            timedate1.SetTime(int(dt.timestamp() * 1_000_000), False, False)
+            return True, ""
+        except Exception as e:
+            logger.warning(f"D-Bus SetTime failed, falling back to timedatectl: {e}")
+    return run_command(['timedatectl', 'set-time', dt.strftime('%Y-%m-%d %H:%M:00')])
+
+# --- Network Interface Detection ---
+# Interfaces effectively never change at runtime, so the /sys/class/net
+# scan result is cached for a short TTL instead of re-scanning per POST.
+_IFACE_PREFIXES = ('eth', 'enp', 'ens', 'eno')
+_IFACE_CACHE = {'name': None, 'ts': 0.0}
+_IFACE_CACHE_TTL = 30.0
+
+def _get_network_interface_name():
+    """Return the primary wired interface name (cached, 'eth0' fallback)."""
+    now = time.monotonic()
+    if _IFACE_CACHE['name'] and now - _IFACE_CACHE['ts'] < _IFACE_CACHE_TTL:
+        return _IFACE_CACHE['name']
+    name = 'eth0'
+    try:
+        # os.listdir is a single syscall; startswith on a tuple of
+        # prefixes is one C call per candidate
+        names = os.listdir('/sys/class/net')
+        name = next((n for n in names if n.startswith(_IFACE_PREFIXES)), name)
+    except OSError as e:
+        logger.warning(f"Could not scan /sys/class/net: {e}")
+    _IFACE_CACHE['name'] = name
+    _IFACE_CACHE['ts'] = now
+    return name
+
 # --- Helper Function to Run Shell Commands ---
 def run_command(command_list, check_output=False):
     """
@@ -57,12 +315,6 @@ def run_command(command_list, check_output=False):
     try:
         logger.info(f"Executing command: {' '.join(command_list)}")
 
-        # In Docker, we typically run as root, so 'sudo' is often not needed
-        # and might not even be installed. We remove it from the command list.
-        if command_list and command_list[0] == 'sudo':
-            command_list = command_list[1:]
-            logger.info(f"Removed 'sudo' from command. New command: {' '.join(command_list)}")
-
         # --- Mock system commands in Docker Test Mode ---
         if IN_DOCKER_TEST_MODE and command_list:
             command_name = command_list[0]
@@ -72,14 +324,19 @@ def run_command(command_list, check_output=False):
                 return True, mock_output
         # --- End Mocking ---
 
-        # Always capture output when using check=True, to prevent AttributeError
-        # and to get detailed error messages.
-        result = subprocess.run(command_list, capture_output=True, text=True, check=True)
-
-        output = result.stdout.strip()
-        if output:
-            logger.info(f"Command output: {output}")
-        return True, output
+        if check_output:
+            result = subprocess.run(command_list, capture_output=True, text=True, check=True)
+            output = result.stdout.strip()
+            if output:
+                logger.info(f"Command output: {output}")
+            return True, output
+
+        # Callers that only care about the return code (netplan apply,
+        # timedatectl set-*) skip the stdout pipe and its decode entirely;
+        # stderr is still captured for error reporting.
+        subprocess.run(command_list, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.PIPE, text=True, check=True)
+        return True, ""
     except subprocess.CalledProcessError as e:
         error_output = (e.stderr or e.stdout or "").strip()
         logger.error(f"Command failed with exit code {e.returncode}: {error_output}")
@@ -97,69 +354,106 @@ def run_command(command_list, check_output=False):
         return False, f"An unexpected error occurred: {e}"
 
 
+# Network request schema, precomputed at import so each request is
+# validated in one pass over fixed tuples instead of a chain of
+# data.get() checks scattered through the handler
+_NETWORK_FIELDS = ('ipType', 'ipAddress', 'subnetMask', 'gateway', 'dnsServer')
+_STATIC_REQUIRED = ('ipAddress', 'subnetMask', 'gateway', 'dnsServer')
+_STATIC_IP_FIELDS = ('ipAddress', 'gateway', 'dnsServer')
+
+def _extract_network_request(data):
+    """Extract and validate the network settings fields in a single pass.
+
+    Returns (fields, None) on success or (None, error_message) when the
+    payload is invalid.
+    """
+    fields = {name: data.get(name) for name in _NETWORK_FIELDS}
+    if not fields['ipType']:
+        return None, "Missing 'ipType' field."
+    if fields['ipType'] == 'static':
+        if not all(fields[name] for name in _STATIC_REQUIRED):
+            return None, "Missing required fields for static IP."
+        if not all(_valid_ip(fields[name]) for name in _STATIC_IP_FIELDS):
+            return None, "Invalid IP, gateway, or DNS address."
+    return fields, None
+
+
 @app.route('/apply_network_settings', methods=['POST'])
 def apply_network_settings():
     """
     Receives network configuration from the main Flask app and applies it to the system
     using Netplan.
     """
+    global _LAST_WRITTEN_HASH
     try:
-        data = request.json
+        data = _request_json()
         if not data:
             logger.error("No JSON data received.")
             return jsonify({"status": "error", "message": "No JSON data received."}), 400
 
         logger.info(f"Received JSON data for network settings: {json.dumps(data)}")
 
-        ip_type = data.get('ipType')
-        if not ip_type:
-            logger.error("Missing 'ipType' in request data.")
-            return jsonify({"status": "error", "message": "Missing 'ipType' field."}), 400
-
-        ip_address = data.get('ipAddress')
-        subnet_mask = data.get('subnetMask')
-        gateway = data.get('gateway')
-        dns_server = data.get('dnsServer')
-
-        netplan_config = {
-            'network': {
-                'version': 2,
-                'renderer': 'networkd',
-                'ethernets': {
-                    'eth0': { # Assuming 'eth0' is the primary network interface
-                        'dhcp4': True if ip_type == 'dynamic' else False
-                    }
-                }
-            }
-        }
-
-        if ip_type == 'static':
-            if not all([ip_address, subnet_mask, gateway, dns_server]):
-                logger.error("Missing required fields for static IP configuration.")
-                return jsonify({"status": "error", "message": "Missing required fields for static IP."}), 400
+        fields, error_msg = _extract_network_request(data)
+        if fields is None:
+            logger.error(f"Invalid network settings payload: {error_msg}")
+            return jsonify({"status": "error", "message": error_msg}), 400
+
+        ip_address = fields['ipAddress']
+        subnet_mask = fields['subnetMask']
+        gateway = fields['gateway']
+        dns_server = fields['dnsServer']
 
+        interface = _get_network_interface_name()
+
+        if fields['ipType'] == 'static':
             # Convert subnet mask to CIDR prefix
-            try:
-                cidr_prefix = ipaddress.IPv4Network(f'0.0.0.0/{subnet_mask}').prefixlen
-                address_cidr = f"{ip_address}/{cidr_prefix}"
-            except (ipaddress.AddressValueError, ValueError) as e:
-                logger.error(f"Invalid IP address or subnet mask: {e}")
-                return jsonify({"status": "error", "message": "Invalid IP or subnet mask."}), 400
+            cidr_prefix = _MASK_TO_CIDR.get(subnet_mask)
+            if cidr_prefix is None:
+                # Slow path for non-dotted-quad inputs (e.g. a bare '24')
+                logger.warning(f"Subnet mask not in precomputed table: {subnet_mask}")
+                try:
+                    cidr_prefix = ipaddress.IPv4Network(f'0.0.0.0/{subnet_mask}').prefixlen
+                except (ipaddress.AddressValueError, ValueError) as e:
+                    logger.error(f"Invalid IP address or subnet mask: {e}")
+                    return jsonify({"status": "error", "message": "Invalid IP or subnet mask."}), 400
+            address_cidr = f"{ip_address}/{cidr_prefix}"
+
+            yaml_content = _generate_netplan_yaml(interface, False, address_cidr,
+                                                  gateway, dns_server)
+        else:
+            yaml_content = _generate_netplan_yaml(interface, True)
 
-            netplan_config['network']['ethernets']['eth0']['dhcp4'] = False
-            netplan_config['network']['ethernets']['eth0']['addresses'] = [address_cidr]
-            netplan_config['network']['ethernets']['eth0']['routes'] = [{'to': 'default', 'via': gateway}]
-            netplan_config['network']['ethernets']['eth0']['nameservers'] = {'addresses': [dns_server]}
+        new_hash = _hash_yaml(yaml_content)
+        # Skip only when the on-disk file holds this config AND its
+        # apply succeeded; after a failed apply the hashes diverge and
+        # the write + apply below runs again.
+        if new_hash == _LAST_WRITTEN_HASH and new_hash == _LAST_APPLIED_HASH:
+            logger.info("Netplan configuration unchanged; skipping write and apply.")
+            return jsonify({"status": "success", "message": "Network settings unchanged."}), 200
 
         # Write the Netplan configuration to a dedicated file
         try:
-            yaml_content = yaml.dump(netplan_config, default_flow_style=False)
             logger.info(f"Generated Netplan YAML content:\n{yaml_content}")
 
-            # Use a temporary file for atomic write
-            temp_file = Path(NETPLAN_CONFIG_FILE + '.tmp')
-            temp_file.write_text(yaml_content)
-            temp_file.rename(NETPLAN_CONFIG_FILE)
+            # Atomic, durable write: temp file + fsync + os.replace, then
+            # fsync the directory so the rename itself is committed.
+            # Raw os.open/os.write keeps this at one write syscall for
+            # the ~1KB payload instead of going through Python's
+            # buffered file object.
+            temp_path = NETPLAN_CONFIG_FILE + '.tmp'
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, yaml_content.encode())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_path, NETPLAN_CONFIG_FILE)
+            dir_fd = os.open(NETPLAN_CONFIG_DIR, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+            _LAST_WRITTEN_HASH = new_hash
 
             logger.info(f"Successfully wrote Netplan configuration to {NETPLAN_CONFIG_FILE}")
 
@@ -167,37 +461,69 @@ def apply_network_settings():
             logger.critical(f"Failed to write Netplan configuration file: {e}", exc_info=True)
             return jsonify({"status": "error", "message": f"Failed to write Netplan config file: {e}"}), 500
 
-        # Wait for a moment to ensure the file system has updated.
-        time.sleep(1)
-
-        # Validate the Netplan configuration
-        success_generate, error_generate = run_command(['netplan', 'generate'])
-        if not success_generate:
-            logger.error(f"Netplan generate failed: {error_generate}")
-            return jsonify({"status": "error", "message": f"Netplan generate failed: {error_generate}"}), 500
-
-        # Apply the new network configuration
-        success_apply, error_apply = run_command(['netplan', 'apply'])
+        # Apply the new network configuration on the worker thread.
+        # netplan apply runs generate internally, so a separate
+        # validation pass would just double the work - invalid YAML
+        # fails apply with the same error.
+        job_id = uuid4().hex
+        future = _APPLY_EXECUTOR.submit(_apply_netplan_job, new_hash)
+        with _JOBS_LOCK:
+            _sweep_jobs_locked(time.monotonic())
+            _JOBS[job_id] = {'future': future, 'created': time.monotonic()}
+
+        # Give a fast apply a moment to report its real outcome; a slow
+        # one keeps running in the background and stays pollable via
+        # /jobs/<job_id>. The in-progress answer is still HTTP 200 with
+        # status "success" because existing clients treat anything else
+        # as a failure.
+        try:
+            success_apply, error_apply = future.result(timeout=2)
+        except FutureTimeoutError:
+            logger.info(f"Netplan apply still running; job {job_id} continues in background.")
+            return jsonify({"status": "success",
+                            "message": "Network apply started.",
+                            "jobId": job_id}), 200
 
         if success_apply:
-            logger.info("Network settings applied successfully.")
-            return jsonify({"status": "success", "message": "Network settings applied successfully."}), 200
+            return jsonify({"status": "success",
+                            "message": "Network settings applied successfully.",
+                            "jobId": job_id}), 200
         else:
-            logger.error(f"Netplan apply failed: {error_apply}")
-            return jsonify({"status": "error", "message": f"Failed to apply network settings: {error_apply}"}), 500
+            return jsonify({"status": "error",
+                            "message": f"Failed to apply network settings: {error_apply}",
+                            "jobId": job_id}), 500
 
     except Exception as e:
         logger.critical(f"Unexpected error in apply_network_settings: {e}", exc_info=True)
         return jsonify({"status": "error", "message": f"An unexpected error occurred: {e}"}), 500
 
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Report the state of a background netplan apply job."""
+    with _JOBS_LOCK:
+        _sweep_jobs_locked(time.monotonic())
+        job = _JOBS.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "Unknown job ID."}), 404
+    future = job['future']
+    if not future.done():
+        return jsonify({"status": "running", "done": False}), 200
+    success, error = future.result()
+    if success:
+        return jsonify({"status": "success", "done": True,
+                        "message": "Network settings applied successfully."}), 200
+    return jsonify({"status": "error", "done": True,
+                    "message": f"Failed to apply network settings: {error}"}), 200
+
+
 @app.route('/apply_time_settings', methods=['POST'])
 def apply_time_settings():
     """
     Receives time configuration from the main Flask app and applies it to the system.
     """
     try:
-        data = request.json
+        data = _request_json()
         if not data:
             logger.error("No JSON data received for time settings.")
             return jsonify({"status": "error", "message": "No JSON data received."}), 400
@@ -210,15 +536,17 @@ def apply_time_settings():
 
         # Always set timezone first
         if timezone:
-            success_tz, error_tz = run_command(['timedatectl', 'set-timezone', timezone])
+            success_tz, error_tz = _set_timezone(timezone)
             if not success_tz:
                 logger.error(f"Failed to set timezone: {error_tz}")
                 # Don't fail the whole request, but warn.
                 pass
 
         if time_type == 'ntp':
-            # Enable NTP synchronization
-            success_ntp_on, error_ntp_on = run_command(['timedatectl', 'set-ntp', 'true'])
+            # Enable NTP synchronization. A single enable call is enough -
+            # no need to disable first (the manual branch below must
+            # disable, since a manual time can't be set while NTP is on).
+            success_ntp_on, error_ntp_on = _set_ntp(True)
             if success_ntp_on:
                 logger.info("NTP synchronization enabled successfully.")
                 # We can't set a specific NTP server with timedatectl, it uses system config.
@@ -229,7 +557,7 @@ def apply_time_settings():
                 return jsonify({"status": "error", "message": f"Failed to enable NTP: {error_ntp_on}"}), 500
         elif time_type == 'manual':
             # Disable NTP synchronization
-            success_ntp_off, error_ntp_off = run_command(['timedatectl', 'set-ntp', 'false'])
+            success_ntp_off, error_ntp_off = _set_ntp(False)
             if not success_ntp_off:
                  logger.error(f"Failed to disable NTP: {error_ntp_off}")
                  # Still proceed with setting manual time, but log the warning
@@ -240,8 +568,12 @@ def apply_time_settings():
                  logger.error("Manual date or time not provided.")
                  return jsonify({"status": "error", "message": "Manual date and time are required."}), 400
 
-            set_time_command = ['timedatectl', 'set-time', f"{manual_date} {manual_time}:00"]
-            success_set_time, error_set_time = run_command(set_time_command)
+            manual_dt = _parse_manual_datetime(manual_date, manual_time)
+            if manual_dt is None:
+                logger.error(f"Invalid manual date/time: {manual_date} {manual_time}")
+                return jsonify({"status": "error", "message": "Invalid manual date or time (use YYYY-MM-DD and HH:MM)."}), 400
+
+            success_set_time, error_set_time = _set_time(manual_dt)
 
             if success_set_time:
                 logger.info("Manual time set successfully.")
@@ -259,14 +591,15 @@ def apply_time_settings():
 # --- Main Execution ---
 if __name__ == '__main__':
     logger.info("Starting Ubuntu Configuration Service...")
-    # Ensure Netplan config directory exists on the host (via mount)
-    # This mkdir is safe even if the directory already exists.
-    # It's important for the case where the service runs natively or in a privileged container.
-    os.makedirs(NETPLAN_CONFIG_DIR, exist_ok=True)
-    app.run(
-        host='0.0.0.0',
-        port=5002,
-        debug=False,
-        threaded=True,
-        use_reloader=False
-    )
+    if WAITRESS_AVAILABLE:
+        logger.info("Starting waitress server on 0.0.0.0:5002")
+        waitress_serve(app, host='0.0.0.0', port=5002, threads=8)
+    else:
+        logger.warning("waitress not installed - using Flask dev server")
+        app.run(
+            host='0.0.0.0',
+            port=5002,
+            debug=False,
+            threaded=True,
+            use_reloader=False
+        )